@@ -0,0 +1,163 @@
+import heapq
+import itertools
+import math
+
+from clock import SystemClock
+from scheduler import AfterHandle
+
+
+class AlertQueue:
+    """
+    Priority queue of the 30min, 5min and end events of every running timer.
+    Pausing or stopping a timer only invalidates that timer's entries, they are
+    dropped lazily as they reach the front of the queue.
+    """
+
+    def __init__(self) -> None:
+        self.heap: list = []
+        self.counter = itertools.count()  # tie-breaker for events at the same time
+        self.generations: dict[int, int] = {}  # current generation of each session
+        self.live: dict[int, int] = {}  # queued current entries of each session
+        self.stale = 0  # queued entries that have been invalidated
+
+    def __len__(self) -> int:
+        return len(self.heap) - self.stale
+
+    def push(self, session, now: float):
+        """
+        Queues the upcoming events of a session, replacing any it already had
+
+        Args:
+            session (engine.TimerSession): a running session
+            now (float): clock.monotonic() reading, events before it are skipped
+            apart from the end of the timer
+        """
+        self.cancel(session)
+        generation = self.generations[session.id]
+
+        for at, event in session.milestones():
+            if at > now or event == "end":
+                heapq.heappush(
+                    self.heap, (at, next(self.counter), generation, event, session)
+                )
+                self.live[session.id] = self.live.get(session.id, 0) + 1
+
+    def cancel(self, session):
+        """
+        Invalidates every queued event of a session
+        """
+        self.stale += self.live.pop(session.id, 0)
+        self.generations[session.id] = self.generations.get(session.id, 0) + 1
+
+        # rebuild once most of the heap is invalidated entries
+        if self.stale > 64 and self.stale > len(self.heap) // 2:
+            self.heap = [entry for entry in self.heap if self.is_current(entry)]
+            heapq.heapify(self.heap)
+            self.stale = 0
+
+    def discard(self, session):
+        """
+        Invalidates every queued event of a session that is gone for good and
+        forgets it
+        """
+        self.cancel(session)
+        self.generations.pop(session.id, None)  # its entries are no longer current
+
+    def is_current(self, entry) -> bool:
+        return entry[2] == self.generations.get(entry[4].id)
+
+    def next_time(self) -> float | None:
+        """
+        Returns:
+            float | None: clock.monotonic() reading of the earliest queued event
+        """
+        while self.heap and not self.is_current(self.heap[0]):
+            heapq.heappop(self.heap)
+            self.stale -= 1
+
+        return self.heap[0][0] if self.heap else None
+
+    def pop_due(self, now: float) -> list:
+        """
+        Removes and returns every event due at or before now
+
+        Returns:
+            list: (session, event) pairs in the order they were due
+        """
+        due = []
+        while (at := self.next_time()) is not None and at <= now:
+            entry = heapq.heappop(self.heap)
+            self.live[entry[4].id] -= 1
+            due.append((entry[4], entry[3]))
+
+        return due
+
+
+class AlertScheduler:
+    def __init__(self, widget, clock=None, sound=None) -> None:
+        """
+        Fires the 30min/5min warnings and ends timers at the exact instant, using
+        one Tk callback that sleeps until the earliest event of any timer.
+        Subscribe handle_event to the TimerEngine to keep it up to date.
+
+        Args:
+            widget (tkinter widget): any widget, used to access after()
+            clock (SystemClock | SimulatedClock, optional): time source.
+            Defaults to the system clock.
+            sound (function, optional): called as sound(event, session) for
+            every alert, e.g. to ring a bell
+        """
+        self.widget = widget
+        self.clock = SystemClock() if clock is None else clock
+        self.sound = sound
+
+        self.queue = AlertQueue()
+        self.handle = AfterHandle(widget)
+        self.wake_at: float | None = None
+
+    def handle_event(self, event, session):
+        """
+        Keeps the queue in step with the timers, only the session that changed
+        has its events added or removed
+        """
+        if event in ("start", "resume"):
+            self.queue.push(session, self.clock.monotonic())
+            self.reschedule()
+        elif event in ("pause", "stop", "finish"):
+            self.queue.cancel(session)
+        elif event == "remove":
+            self.queue.discard(session)
+
+    def reschedule(self):
+        """
+        Sleeps until the earliest queued event, if it moved earlier
+        """
+        at = self.queue.next_time()
+        if at is None or self.clock.speed <= 0:
+            return
+
+        if self.handle.pending and self.wake_at <= at:
+            return
+
+        delay = (at - self.clock.monotonic()) / self.clock.speed
+        self.wake_at = at
+        self.handle.schedule(max(0, math.ceil(delay * 1000)), self.fire)
+
+    def fire(self):
+        """
+        Fires every event that is due, then sleeps until the next one
+        """
+        self.handle.cancel()  # when called early, e.g. by Ctrl+J
+        self.wake_at = None
+
+        now = self.clock.monotonic()
+        for session, event in self.queue.pop_due(now):
+            if event == "end":
+                session.tick(now)  # finishes the timer
+            else:
+                session.notify(event)
+
+            if self.sound:
+                self.sound(event, session)
+
+        self.reschedule()
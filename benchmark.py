@@ -0,0 +1,318 @@
+# benchmarks for grouping, ticking and rendering with 10, 100 and 1000 subjects
+#
+#   python benchmark.py [--sizes 10 100 1000] [--output results.json] [--headless]
+#                       [--single-canvas]
+#
+# the logic benchmarks (engine, alerts, import) don't need a display.
+# the widget benchmarks do, on a server run them under Xvfb:
+#   xvfb-run python benchmark.py
+# results are written as JSON so they can be compared release over release
+
+import argparse
+import csv
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+from alerts import AlertQueue
+from clock import SimulatedClock
+from engine import TimerEngine
+from importer import FIELDS, read_schedule
+from model import Section, Subject, SubjectRegistry
+
+# section durations to pick from, in minutes
+DURATIONS = list(range(30, 181, 15))
+
+
+def measure(name, size, run, setup=None, repeat=20):
+    """
+    Times run(setup()) repeat times
+
+    Args:
+        name (str): name of the benchmark
+        size (int): number of subjects
+        run (function): code being measured, gets the result of setup()
+        setup (function, optional): untimed preparation before each run
+        repeat (int, optional): number of runs. Defaults to 20.
+
+    Returns:
+        dict: timings in milliseconds
+    """
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        run(state)
+        times.append((time.perf_counter() - start) * 1000)
+
+    result = {
+        "name": name,
+        "size": size,
+        "runs": repeat,
+        "mean_ms": statistics.fmean(times),
+        "median_ms": statistics.median(times),
+        "min_ms": min(times),
+        "max_ms": max(times),
+    }
+    median = result["median_ms"]
+    print(f"{name:<36} {size:>5} {median:>10.3f} ms", file=sys.stderr)
+    return result
+
+
+def logic_benchmarks(size):
+    results = []
+    rng = random.Random(size)
+
+    def started_engine():
+        clock = SimulatedClock(speed=0)
+        engine = TimerEngine(clock)
+        for index in range(size):
+            minutes = rng.choice(DURATIONS)
+            engine.create_session(
+                datetime.timedelta(minutes=minutes), [Subject(f"Subject {index}", 0)]
+            )
+        engine.start()
+        return engine
+
+    engine = started_engine()
+
+    def tick(_):
+        engine.clock.advance(1)
+        engine.tick()
+
+    results.append(measure("TimerEngine.tick", size, tick, repeat=100))
+    results.append(
+        measure("TimerEngine.next_event", size, lambda _: engine.next_event())
+    )
+
+    def fill_queue():
+        queue = AlertQueue()
+        for session in engine.sessions:
+            queue.push(session, engine.clock.monotonic())
+        return queue
+
+    def drain_queue(queue):
+        while (at := queue.next_time()) is not None:
+            queue.pop_due(at)
+
+    results.append(
+        measure("AlertQueue.push", size, lambda _: fill_queue(), repeat=10)
+    )
+    results.append(
+        measure("AlertQueue.pop_due", size, drain_queue, fill_queue, repeat=10)
+    )
+
+    def replay_day(_):
+        day = started_engine()
+        day.run_until_finished()
+
+    results.append(
+        measure("TimerEngine.run_until_finished", size, replay_day, repeat=5)
+    )
+
+    # two sections per subject
+    handle, path = tempfile.mkstemp(suffix=".csv")
+    with os.fdopen(handle, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        for index in range(size):
+            for paper in (1, 2):
+                writer.writerow(
+                    {
+                        "subject": f"Subject {index}",
+                        "level": "HL",
+                        "section": f"Paper {paper}",
+                        "hours": 1,
+                        "minutes": 30,
+                    }
+                )
+
+    results.append(
+        measure("importer.read_schedule", size, lambda _: read_schedule(path))
+    )
+    os.remove(path)
+
+    return results
+
+
+def count_widgets(widget) -> int:
+    """
+    Number of widgets below a widget, including itself
+    """
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def widget_benchmarks(app, size):
+    from editor import EditorSubjectList  # pylint: disable=import-outside-toplevel
+
+    results = []
+    rng = random.Random(size)
+    page = app.timer_page
+
+    def reset():
+        """
+        Removes every timer and subject, then adds size new subjects
+        """
+        for timer in list(page.timers):
+            page.remove_timer(timer)
+
+        app.subjects = SubjectRegistry()
+        for index in range(size):
+            subject = Subject(f"Subject {index}", index % 2)
+            for paper in (1, 2):
+                minutes = rng.choice(DURATIONS)
+                subject.sections.append(
+                    Section(f"Paper {paper}", minutes // 60, minutes % 60)
+                )
+            app.add_subject(subject)
+            page.mark_dirty(subject.id)
+
+        app.root.update_idletasks()
+
+    def group(_):
+        page.group_timers()
+        page.draw_timers()
+        app.root.update_idletasks()
+
+    results.append(measure("TimerPage.group_timers", size, group, reset, repeat=5))
+
+    reset()
+    group(None)
+    page.start_timers()
+    results.append(
+        {"name": "TimerPage widgets", "size": size, "count": count_widgets(page)}
+    )
+
+    def tick(_):
+        app.clock.advance(1)
+        page.tick()
+        app.root.update_idletasks()  # includes the batched redraw
+
+    results.append(measure("TimerPage.tick", size, tick, repeat=50))
+
+    bar = page.timers[0].progress_bar
+    duration = page.timers[0].duration
+
+    def update_bar(_):
+        for second in range(100):
+            elapsed = datetime.timedelta(seconds=second)
+            bar.update(elapsed, duration - elapsed, duration)
+        app.root.update_idletasks()
+
+    results.append(measure("ProgressBar.update x100", size, update_bar))
+
+    def finish_all():
+        reset()
+        group(None)
+        page.start_timers()
+        page.engine.run_until_finished()
+        app.root.update_idletasks()
+
+    def advance(_):
+        page.advance_timers()
+        app.root.update_idletasks()
+
+    results.append(
+        measure("TimerPage.advance_timers", size, advance, finish_all, repeat=3)
+    )
+
+    popup = tk.Toplevel(app.root)
+    canvas = tk.Canvas(popup)
+    canvas.pack(fill="both", expand=True)
+    subject_list = EditorSubjectList(
+        canvas, print, print, print, print, app.subjects
+    )
+
+    subjects = list(app.subjects)
+
+    def empty_list():
+        for subject in subjects:
+            subject_list.delete_subject(subject.id)
+        app.root.update_idletasks()
+
+    def insert_all(_):
+        subject_list.insert_subjects(subjects)
+        app.root.update_idletasks()
+
+    results.append(
+        measure("EditorSubjectList.insert_subjects", size, insert_all, empty_list)
+    )
+
+    # a subject in the middle of the list, removed and added back each run
+    middle = subjects[len(subjects) // 2]
+
+    def reinsert(_):
+        subject_list.delete_subject(middle.id)
+        subject_list.insert_subject(middle)
+        app.root.update_idletasks()
+
+    results.append(
+        measure("EditorSubjectList.delete+insert_subject", size, reinsert, repeat=100)
+    )
+    popup.destroy()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmarks grouping, ticking and rendering at scale"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--output", help="file to write the JSON results to")
+    parser.add_argument(
+        "--headless", action="store_true", help="skip the widget benchmarks"
+    )
+    parser.add_argument(
+        "--single-canvas",
+        action="store_true",
+        help="draw the timers on one canvas, as with EXAM_CLOCK_SINGLE_CANVAS",
+    )
+    args = parser.parse_args()
+
+    if args.single_canvas:
+        os.environ["EXAM_CLOCK_SINGLE_CANVAS"] = "1"
+
+    report = {
+        "timestamp": datetime.datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "renderer": "single canvas" if args.single_canvas else "widgets",
+        "results": [],
+        "skipped": [],
+    }
+
+    for size in args.sizes:
+        report["results"] += logic_benchmarks(size)
+
+    app = None
+    if not args.headless:
+        try:
+            from main import App  # pylint: disable=import-outside-toplevel
+
+            app = App(SimulatedClock(speed=0))
+        except tk.TclError as exception:
+            report["skipped"].append(f"widget benchmarks: {exception}")
+
+    if app:
+        for size in args.sizes:
+            report["results"] += widget_benchmarks(app, size)
+        app.root.destroy()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,567 @@
+# single canvas renderer for the TimerPage
+# instead of a tree of frames, labels and a progressbar per timer, every timer is
+# drawn as text and rectangle items on one canvas shared by the whole page.
+# a tick only changes the text and coordinates of a few items, and there is no
+# geometry management to redo when timers are added, moved or resized
+
+import ttkbootstrap as ttk
+
+from glyphs import DigitReadout
+from scheduler import AfterHandle
+from style import HEADING, TIMER_HEIGHT, TIMER_WIDTH, scaled_font
+from timer import Info, ProgressBar, SubjectLabel, SubjectList, Timer
+
+# timers that aren't on the current page are moved here, well outside the canvas
+OFFSCREEN = -10000
+
+# sizes at a scale of 1, the same as the widgets of a Timer
+PADDING = 10  # around each timer
+WIDTH = 440  # of the text and progressbar
+PROGRESS_HEIGHT = 120  # of the elapsed/remaining text and progressbar
+BAR_HEIGHT = 16  # thickness of the progressbar
+
+
+def text_bottom(canvas, item, default):
+    """
+    Bottom edge of a text item, default if it has no bounding box
+    """
+    bbox = canvas.bbox(item)
+    return bbox[3] if bbox else default
+
+
+class CanvasTimer(Timer):
+    id_counter: int = 0
+
+    def __init__(
+        self, canvas, callback, session, renderer=None, animator=None
+    ) -> None:
+        """
+        A Timer drawn on the canvas shared by the TimerPage, used in single
+        canvas mode. Behaves like a Timer, but instead of widgets it owns canvas
+        items tagged with its own tag, placed in its (row, column) cell.
+
+        Args:
+            canvas (tkinter.Canvas): canvas shared by every timer on the page
+            callback (function): TimerPage.finish()
+            session (engine.TimerSession): session holding the timer's state
+            renderer (render.RenderQueue, optional): batches per-tick redraws
+            animator (render.ProgressAnimator, optional): moves the progressbar
+            smoothly between ticks while the timer is running and on the page
+        """
+        self.canvas = canvas
+        self.tag = f"timer{CanvasTimer.id_counter}"
+        CanvasTimer.id_counter += 1
+
+        super().__init__(canvas, callback, session, renderer, animator)
+
+    def create_widgets(self, parent):
+        """
+        Creates the progressbar and subject list items, placed off the canvas
+        until the TimerPage gives the timer a position
+        """
+        self.progress_bar = CanvasProgressBar(parent, self.tag, self.renderer)
+        self.subject_list = CanvasSubjectList(parent, self.tag)
+        self.layout()
+
+    def origin(self):
+        """
+        Returns:
+            tuple: (x, y) of the top left corner inside the timer's padding,
+            off the canvas if the timer isn't on the page
+        """
+        if self.position is None:
+            return OFFSCREEN, OFFSCREEN
+
+        row, column = self.position
+        padding = round(PADDING * self.scale)
+        return (
+            column * round(TIMER_WIDTH * self.scale) + padding,
+            row * round(TIMER_HEIGHT * self.scale) + padding,
+        )
+
+    def layout(self):
+        """
+        Places every item of the timer in its cell at its scale
+        """
+        x, y = self.origin()
+        self.progress_bar.place(x, y, self.scale)
+        self.subject_list.place(x, y + round(PROGRESS_HEIGHT * self.scale), self.scale)
+        if self.info:
+            self.place_info(self.info)
+
+    def place_info(self, info):
+        """
+        Places the Info at the bottom of the timer's cell
+        """
+        x, y = self.origin()
+        info.place(x, y + round((TIMER_HEIGHT - 2 * PADDING) * self.scale), self.scale)
+
+    def create_info(self, session):
+        info = CanvasInfo(
+            self.canvas,
+            self.tag,
+            session.duration,
+            session.start_time,
+            session.end_time,
+        )
+        self.place_info(info)
+        return info
+
+    def set_position(self, position):
+        """
+        Called by TimerPage.draw_timers() to move the timer to a (row, column)
+        of the page, or off the canvas if position is None
+        """
+        if position != self.position:
+            self.position = position
+            self.layout()
+
+    def set_scale(self, scale):
+        if scale != self.scale:
+            self.scale = scale
+            self.layout()
+
+    def destroy(self):
+        """
+        Deletes the timer's items and stops listening to the session
+        """
+        self.release()
+        self.canvas.delete(self.tag)
+
+
+class CanvasProgressBar(ProgressBar):
+    def __init__(self, canvas, tag, renderer=None) -> None:
+        """
+        The elapsed/remaining text and progressbar of a CanvasTimer
+        The progressbar is a trough and a bar rectangle, alerts flash a
+        rectangle behind the text instead of the canvas background.
+
+        Args:
+            canvas (tkinter.Canvas): canvas shared by every timer on the page
+            tag (str): tag of the timer, given to every item
+            renderer (render.RenderQueue, optional): batches item writes,
+            they are applied immediately if not given
+        """
+        self.canvas = canvas
+        self.tag = tag
+
+        # position of the top left corner and width, set by place()
+        self.x = OFFSCREEN
+        self.y = OFFSCREEN
+        self.width = WIDTH
+        self.percent = 0
+
+        super().__init__(canvas, renderer)
+
+    def create_widgets(self, parent):
+        """
+        Creates the text and rectangle items, placed off the canvas
+        """
+        canvas = parent
+        tag = self.tag
+        self.background = canvas.cget("background")
+        self.flash_handle = AfterHandle(canvas)
+
+        self.backdrop = canvas.create_rectangle(
+            0, 0, 0, 0, fill=self.background, outline="", tags=tag
+        )
+
+        self.elapsed_heading = canvas.create_text(
+            0, 0, anchor="nw", text="ELAPSED", fill="#121212", font=HEADING[3], tags=tag
+        )
+        self.elapsed_label = DigitReadout(
+            canvas, 0, 0, HEADING[1], anchor="nw", text="00:00", tags=tag
+        )
+
+        self.remaining_heading = canvas.create_text(
+            0,
+            0,
+            anchor="ne",
+            text="REMAINING",
+            fill="#121212",
+            font=HEADING[2],
+            tags=tag,
+        )
+        self.remaining_label = DigitReadout(
+            canvas, 0, 0, HEADING[1], anchor="ne", text="00:00", tags=tag
+        )
+
+        # same colours as a ttk Progressbar in the current theme
+        style = ttk.Style()
+        self.trough = canvas.create_rectangle(
+            0,
+            0,
+            0,
+            0,
+            fill=style.lookup("TProgressbar", "troughcolor") or "#E5E5E5",
+            outline="",
+            tags=tag,
+        )
+        self.bar = canvas.create_rectangle(
+            0,
+            0,
+            0,
+            0,
+            fill=style.lookup("TProgressbar", "background") or "#4582EC",
+            outline="",
+            tags=tag,
+        )
+
+    def set_progress(self, percent):
+        self.percent = percent
+
+        top = self.y + round(70 * self.scale)
+        self.canvas.coords(
+            self.bar,
+            self.x,
+            top,
+            self.x + self.width * percent / 100,
+            top + round(BAR_HEIGHT * self.scale),
+        )
+
+    def set_background(self, colour):
+        self.canvas.itemconfigure(self.backdrop, fill=colour)
+
+    def set_scale(self, scale):
+        """
+        Resizes the items in place
+
+        Args:
+            scale (float): size relative to the design size (440px wide)
+        """
+        self.place(self.x, self.y, scale)
+
+    def place(self, x, y, scale):
+        """
+        Moves the items to the given top left corner and resizes them
+
+        Args:
+            x (int): left edge
+            y (int): top edge
+            scale (float): size relative to the design size (440px wide)
+        """
+        if scale != self.scale:
+            self.scale = scale
+            self.canvas.itemconfigure(
+                self.elapsed_heading, font=scaled_font(HEADING[3], scale)
+            )
+            self.canvas.itemconfigure(
+                self.remaining_heading, font=scaled_font(HEADING[2], scale)
+            )
+
+            font = scaled_font(
+                HEADING[1], scale, "overstrike" if self.overstrike else ""
+            )
+            self.elapsed_label.configure(font=font)
+            self.remaining_label.configure(font=font)
+
+        self.x = x
+        self.y = y
+        self.width = width = round(WIDTH * scale)
+
+        self.canvas.coords(
+            self.backdrop, x, y, x + width, y + round(PROGRESS_HEIGHT * scale)
+        )
+        self.canvas.coords(self.elapsed_heading, x, y)
+        self.canvas.coords(self.remaining_heading, x + width, y)
+        self.elapsed_label.move_to(x, y + round(25 * scale))
+        self.remaining_label.move_to(x + width, y + round(25 * scale))
+
+        top = y + round(70 * scale)
+        self.canvas.coords(
+            self.trough, x, top, x + width, top + round(BAR_HEIGHT * scale)
+        )
+        self.set_progress(self.percent)
+
+
+class CanvasSubjectList(SubjectList):
+    def __init__(self, canvas, tag) -> None:
+        """
+        The subject names of a CanvasTimer, stacked below each other
+
+        Args:
+            canvas (tkinter.Canvas): canvas shared by every timer on the page
+            tag (str): tag of the timer, given to every item
+        """
+        self.canvas = canvas
+        self.tag = tag
+
+        # top left corner, set by place(), and bottom of the last label
+        self.x = OFFSCREEN
+        self.y = OFFSCREEN
+        self.bottom = OFFSCREEN
+
+        super().__init__(canvas, [])
+
+    def create_widgets(self, parent):
+        """
+        Nothing to create, each label draws its own items on the canvas
+        """
+
+    def set_subjects(self, subjects):
+        """
+        Replaces every label, used when the timer is reused for another session
+
+        Args:
+            subjects (list): list of Subject objects in the timer
+        """
+        for label in self.labels.values():
+            label.destroy()
+        self.labels = {}
+        self.row_count = 0
+        self.bottom = self.y
+
+        for subject in subjects:
+            self.add_subject(subject)
+
+    def add_subject(self, subject):
+        """
+        Adds a label for the subject's first section not run below the others
+
+        Args:
+            subject (Subject): Subject object to add
+        """
+        section = subject.next_section()
+        if section:
+            label = CanvasSubjectLabel(
+                self.canvas,
+                self.tag,
+                self.layout,
+                subject.name,
+                subject.level,
+                subject.id,
+                section.name,
+            )
+            self.labels[subject.id] = label
+            self.row_count += 1
+            self.bottom = label.place(self.x, self.bottom, self.scale)
+
+    def remove_subject(self, subject_id):
+        """
+        Removes the label of the subject with the given ID, moving up the rest
+
+        Args:
+            subject_id (int): id of the subject to remove
+        """
+        label = self.labels.pop(subject_id, None)
+        if label:
+            label.destroy()
+            self.layout()
+
+    def set_scale(self, scale):
+        """
+        Resizes every label in place, and the labels added later
+
+        Args:
+            scale (float): size relative to the design size
+        """
+        self.place(self.x, self.y, scale)
+
+    def place(self, x, y, scale):
+        """
+        Moves the list to the given top left corner and resizes it
+        """
+        self.x = x
+        self.y = y
+        self.scale = scale
+        self.layout()
+
+    def layout(self):
+        """
+        Stacks the labels in the order they were added, e.g. after one of them
+        changed and wraps onto more or fewer lines
+        """
+        self.bottom = self.y
+        for label in self.labels.values():
+            self.bottom = label.place(self.x, self.bottom, self.scale)
+
+
+class CanvasSubjectLabel(SubjectLabel):
+    def __init__(
+        self,
+        canvas,
+        tag,
+        relayout,
+        subject_name,
+        subject_level,
+        subject_id,
+        section_name,
+    ) -> None:
+        """
+        A subject's name and section drawn as two text items, wrapped to the
+        width of the timer
+
+        Args:
+            canvas (tkinter.Canvas): canvas shared by every timer on the page
+            tag (str): tag of the timer, given to every item
+            relayout (function): CanvasSubjectList.layout(), called when the
+            label changes as it may now take up more or fewer lines
+            subject_name (str): name of the subject
+            subject_level (int): level of the subject (1 for HL, 0 for SL)
+            subject_id (int): id of the subject
+            section_name (str): name of the section
+        """
+        self.canvas = canvas
+        self.tag = tag
+        self.relayout = None  # not placed yet
+
+        super().__init__(
+            canvas, subject_name, subject_level, subject_id, section_name
+        )
+        self.relayout = relayout
+
+    def create_widgets(self, parent):
+        """
+        Creates the subject and section name text items, off the canvas
+        """
+        self.subject_name_item = parent.create_text(
+            OFFSCREEN,
+            OFFSCREEN,
+            anchor="nw",
+            width=WIDTH,
+            fill="#121212",
+            font=HEADING[1],
+            tags=self.tag,
+        )
+        self.section_name_item = parent.create_text(
+            OFFSCREEN,
+            OFFSCREEN,
+            anchor="nw",
+            width=WIDTH,
+            fill="#838383",
+            font=HEADING[2],
+            tags=self.tag,
+        )
+
+    def release(self):
+        self.destroy()
+
+    def destroy(self):
+        self.canvas.delete(self.subject_name_item, self.section_name_item)
+
+    def update_details(self, name=None, level=None, section_name=None):
+        """
+        Updates the text items based on new data
+
+        Args:
+            name (str): new name of the subject
+            level (int): new level of the subject
+            section_name (str): new name of the section
+        """
+        if name is not None:
+            self.subject_name = name
+        if level is not None:
+            self.subject_level = level
+        self.canvas.itemconfigure(self.subject_name_item, text=self.display_name)
+
+        if section_name is not None:
+            self.canvas.itemconfigure(self.section_name_item, text=section_name)
+
+        if self.relayout:
+            self.relayout()
+
+    def set_scale(self, scale):
+        """
+        Resizes the text and the width it wraps at, the CanvasSubjectList
+        moves the label with place() as it may now take up more or fewer lines
+
+        Args:
+            scale (float): size relative to the design size (440px wide)
+        """
+        if scale == self.scale:
+            return
+
+        self.scale = scale
+        width = round(WIDTH * scale)
+        self.canvas.itemconfigure(
+            self.subject_name_item, width=width, font=scaled_font(HEADING[1], scale)
+        )
+        self.canvas.itemconfigure(
+            self.section_name_item, width=width, font=scaled_font(HEADING[2], scale)
+        )
+
+    def place(self, x, y, scale) -> int:
+        """
+        Moves the label to the given top left corner and resizes it
+
+        Returns:
+            int: bottom edge of the label, where the next one goes
+        """
+        self.set_scale(scale)
+        self.canvas.coords(self.subject_name_item, x, y)
+        y = text_bottom(self.canvas, self.subject_name_item, y)
+        self.canvas.coords(self.section_name_item, x, y)
+        return text_bottom(self.canvas, self.section_name_item, y)
+
+
+class CanvasInfo(Info):
+    def __init__(self, canvas, tag, duration, start_time, end_time) -> None:
+        """
+        The start/end times and warnings of a CanvasTimer, drawn as two lines
+        at the bottom of the timer once it has started
+
+        Args:
+            canvas (tkinter.Canvas): canvas shared by every timer on the page
+            tag (str): tag of the timer, given to every item
+            duration (datetime.timedelta): total duration of the timer
+            start_time (datetime.datetime): start time of the timer
+            end_time (datetime.datetime): end time of the timer
+        """
+        self.canvas = canvas
+        self.tag = tag
+
+        super().__init__(canvas, duration, start_time, end_time)
+
+    def create_widgets(self, parent):
+        """
+        Creates the start/end times and warnings text items, off the canvas
+        """
+        self.times_item = parent.create_text(
+            OFFSCREEN,
+            OFFSCREEN,
+            anchor="sw",
+            fill="#838383",
+            font=HEADING[4],
+            tags=self.tag,
+        )
+        self.warnings_item = parent.create_text(
+            OFFSCREEN,
+            OFFSCREEN,
+            anchor="sw",
+            fill="#838383",
+            font=HEADING[4],
+            tags=self.tag,
+        )
+
+    def set_text(self, times, warnings):
+        self.canvas.itemconfigure(self.times_item, text=times)
+        self.canvas.itemconfigure(self.warnings_item, text=warnings)
+
+    def set_scale(self, scale):
+        """
+        Resizes the text, the CanvasTimer moves it with place() as the lines
+        are now taller or shorter
+
+        Args:
+            scale (float): size relative to the design size
+        """
+        if scale == self.scale:
+            return
+
+        self.scale = scale
+        font = scaled_font(HEADING[4], scale)
+        self.canvas.itemconfigure(self.times_item, font=font)
+        self.canvas.itemconfigure(self.warnings_item, font=font)
+
+    def place(self, x, bottom, scale):
+        """
+        Moves the two lines so that the warnings line ends at the given bottom
+        """
+        self.set_scale(scale)
+        font = scaled_font(HEADING[4], scale)
+        line = int(self.canvas.tk.call("font", "metrics", font, "-linespace"))
+        self.canvas.coords(self.warnings_item, x, bottom)
+        self.canvas.coords(self.times_item, x, bottom - line)
+
+    def destroy(self):
+        self.canvas.delete(self.times_item, self.warnings_item)
@@ -0,0 +1,108 @@
+import datetime
+import time
+
+
+class SystemClock:
+    """
+    The real clock, used by default.
+    Everything that needs the time reads it through a clock object so that a
+    SimulatedClock can be swapped in to run exams faster than real time.
+    """
+
+    speed = 1.0
+
+    def monotonic(self) -> float:
+        """
+        Returns:
+            float: seconds on a clock that never jumps, used for timer arithmetic
+        """
+        return time.monotonic()
+
+    def now(self) -> datetime.datetime:
+        """
+        Returns:
+            datetime.datetime: local wall clock time, used for display
+        """
+        return datetime.datetime.now()
+
+    def until_next_second(self) -> float:
+        """
+        Returns:
+            float: real seconds until the displayed wall clock second changes
+        """
+        return self.until_next(1.0)
+
+    def until_next(self, step: float) -> float:
+        """
+        Returns:
+            float: real seconds until the wall clock reaches the next multiple of
+            step seconds, e.g. 0.1 for the next tenth of a second
+        """
+        return step - time.time() % step
+
+
+class SimulatedClock:
+    def __init__(
+        self, start: datetime.datetime | None = None, speed: float = 1.0
+    ) -> None:
+        """
+        A clock that runs at a multiple of real time and can be moved forward
+        instantly, e.g. to replay a whole mock exam day in seconds.
+
+        Args:
+            start (datetime.datetime, optional): simulated wall clock time to start
+            at. Defaults to the current time.
+            speed (float, optional): simulated seconds per real second, 0 freezes
+            the clock so it only moves with advance()/jump_to(). Defaults to 1.0.
+        """
+        self.start = datetime.datetime.now() if start is None else start
+        self.speed = speed
+
+        # simulated time is anchored to a real monotonic reading
+        self.simulated = 0.0
+        self.anchor = time.monotonic()
+
+    def monotonic(self) -> float:
+        return self.simulated + (time.monotonic() - self.anchor) * self.speed
+
+    def now(self) -> datetime.datetime:
+        return self.start + datetime.timedelta(seconds=self.monotonic())
+
+    def until_next_second(self) -> float:
+        return self.until_next(1.0)
+
+    def until_next(self, step: float) -> float:
+        if self.speed <= 0:
+            return 1.0
+
+        return (step - self.monotonic() % step) / self.speed
+
+    def set_speed(self, speed: float):
+        """
+        Changes the speed without moving the current simulated time
+
+        Args:
+            speed (float): simulated seconds per real second
+        """
+        self.simulated = self.monotonic()
+        self.anchor = time.monotonic()
+        self.speed = speed
+
+    def advance(self, seconds: float):
+        """
+        Moves the clock forward instantly
+
+        Args:
+            seconds (float): simulated seconds to skip
+        """
+        self.simulated += seconds
+
+    def jump_to(self, target: float):
+        """
+        Moves the clock forward to the given monotonic reading, never backwards
+
+        Args:
+            target (float): monotonic() reading to jump to, e.g. from
+            TimerEngine.next_event()
+        """
+        self.advance(max(0.0, target - self.monotonic()))
@@ -0,0 +1,137 @@
+import collections
+import gc
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# python classes whose live instances are counted, by name
+COMPONENTS = (
+    "Timer",
+    "ProgressBar",
+    "SubjectList",
+    "SubjectLabel",
+    "Info",
+    "DigitReadout",
+    "EditorSectionList",
+    "EditorSection",
+    "EditorSectionModify",
+    "EditorSubjectList",
+    "CanvasTimer",
+    "CanvasSubjectLabel",
+    "CanvasInfo",
+    "TimerSession",
+    "Subject",
+    "Section",
+)
+
+
+def callback_name(command: str) -> str:
+    """
+    Name of the python function behind a command registered by tkinter,
+    which prefixes the function name with an ID, e.g. "140523776tick" -> "tick"
+    """
+    return re.sub(r"^\d+", "", str(command)) or str(command)
+
+
+class LeakDetector:
+    def __init__(self, root) -> None:
+        """
+        Counts what stays alive in Tk between cycles of the app (e.g. pressing
+        "Next" or closing the editor) to catch things that are never cleaned up:
+        widgets and canvas items by class, pending after() callbacks and
+        variable traces by the function they call, registered Tcl commands and
+        live python components by class.
+
+        Args:
+            root (tkinter.Tk): the app's root window
+        """
+        self.root = root
+        self.snapshots: dict[str, collections.Counter] = {}  # last one per cycle
+        self.growth: dict[str, list] = collections.defaultdict(list)
+
+    def snapshot(self) -> collections.Counter:
+        """
+        Returns:
+            Counter: current count of everything that is tracked, keyed like
+            "widget:Canvas", "after:flash", "trace:validate" or "Timer"
+        """
+        counts: collections.Counter = collections.Counter()
+        tk = self.root.tk
+
+        # widgets, walked from the root
+        pending = [self.root]
+        while pending:
+            widget = pending.pop()
+            children = widget.winfo_children()
+            pending.extend(children)
+            for child in children:
+                widget_class = child.winfo_class()
+                counts[f"widget:{widget_class}"] += 1
+                if widget_class == "Canvas":
+                    counts["canvas items"] += len(child.find_all())
+
+        for after_id in tk.splitlist(tk.call("after", "info")):
+            script = tk.splitlist(tk.call("after", "info", after_id))[0]
+            counts[f"after:{callback_name(script)}"] += 1
+
+        # tkinter names its variables PY_VAR0, PY_VAR1, ...
+        for variable in tk.splitlist(tk.call("info", "globals", "PY_VAR*")):
+            for trace in tk.splitlist(tk.call("trace", "info", "variable", variable)):
+                command = tk.splitlist(trace)[1]
+                counts[f"trace:{callback_name(command)}"] += 1
+
+        counts["tcl commands"] = len(tk.splitlist(tk.call("info", "commands")))
+
+        gc.collect()  # only count components that are actually still referenced
+        for obj in gc.get_objects():
+            name = type(obj).__name__
+            if name in COMPONENTS:
+                counts[name] += 1
+
+        return counts
+
+    def check(self, cycle: str) -> dict[str, int]:
+        """
+        Compares the current counts with the last check of the same cycle and
+        logs anything that grew
+
+        Args:
+            cycle (str): what was just done, e.g. "next" or "editor"
+
+        Returns:
+            dict: how much each count grew by since the last check
+        """
+        current = self.snapshot()
+        previous = self.snapshots.get(cycle)
+        self.snapshots[cycle] = current
+
+        if previous is None:
+            return {}
+
+        grown = {
+            key: current[key] - previous[key]
+            for key in current
+            if current[key] > previous[key]
+        }
+        self.growth[cycle].append(grown)
+
+        if grown:
+            logger.warning(
+                "After %s: %s",
+                cycle,
+                ", ".join(f"{key} +{delta}" for key, delta in sorted(grown.items())),
+            )
+        return grown
+
+    def leaks(self, cycle: str, cycles: int = 3) -> list[str]:
+        """
+        Returns:
+            list: counts that grew in each of the last few checks of a cycle,
+            growth that keeps going rather than a pool or cache filling up
+        """
+        recent = self.growth[cycle][-cycles:]
+        if len(recent) < cycles:
+            return []
+
+        return sorted(set.intersection(*(set(grown) for grown in recent)))
@@ -1,5 +1,6 @@
+import bisect
 from tkinter import Canvas, Entry, Listbox, StringVar, IntVar
-from tkinter.constants import SINGLE, END
+from tkinter.constants import SINGLE
 
 import ttkbootstrap as ttk
 
@@ -8,7 +9,7 @@ from style import HEADING, round_rectangle
 
 # list of sections, handles creating and removing sections, numbering, etc.
 class EditorSectionList:
-    def __init__(self, parent, existing_sections, callback) -> None:
+    def __init__(self, parent, existing_sections, callback, pool) -> None:
         """
         Init a new instance of the UI component for editing a subject's sections
 
@@ -16,9 +17,12 @@ class EditorSectionList:
             parent (tkinter parent): A canvas housing all elements in EditorPage
             existing_sections (list): List of Section's the selected subject already has
             callback (function): EditorPage.register_sections()
+            pool (pool.WidgetPool): EditorSection components to reuse, they are
+            returned to it instead of being destroyed
         """
         self.parent = parent
         self.callback = callback
+        self.pool = pool
 
         # stores the UI components
         self.components = []
@@ -28,8 +32,7 @@ class EditorSectionList:
         if len(existing_sections) > 0:
             for index, section in enumerate(existing_sections):
                 self.components.append(
-                    EditorSection(
-                        self.parent,
+                    self.pool.acquire(
                         self,
                         index + 1,
                         section.name,
@@ -41,7 +44,7 @@ class EditorSectionList:
             self.section_count = len(existing_sections)
 
         # init heading
-        self.parent.create_text(
+        self.heading = self.parent.create_text(
             522, 48, anchor="nw", text="Sections:", fill="#121212", font=HEADING[1]
         )
 
@@ -56,7 +59,7 @@ class EditorSectionList:
         self.section_count += 1
         self.modify.place()  # move modification buttons
 
-        self.components.append(EditorSection(self.parent, self, self.section_count))
+        self.components.append(self.pool.acquire(self, self.section_count))
 
         self.validate_entries()
 
@@ -68,8 +71,7 @@ class EditorSectionList:
         self.section_count -= 1
         self.modify.place()  # move modification buttons
 
-        self.components[-1].canvas.destroy()
-        self.components.pop(-1)
+        self.pool.release(self.components.pop(-1))
 
         self.validate_entries()
 
@@ -120,12 +122,14 @@ class EditorSectionList:
         before a new instance of EditorSectionList is created to configure the new
         subject's sections
         """
+        self.parent.delete(self.heading)
         self.modify.add_button.destroy()
         self.modify.remove_button.destroy()
         self.modify.save_button.destroy()
 
         for component in self.components:
-            component.canvas.destroy()
+            self.pool.release(component)
+        self.components = []
 
 
 class EditorSection:
@@ -149,19 +153,18 @@ class EditorSection:
             hours (int, optional): Hour duration of section (if existing).
             minutes (int, optional): Minute duration of section (if existing).
         """
-        self.controller = controller
+        self.controller = None
         self.canvas = Canvas(parent, width=600, height=120)
-        self.canvas.place(x=522.0, y=(96.0 + (138 * (section_number - 1))))
 
-        # values will be populated if section already exists
-        self.name_var = StringVar(self.canvas, value=name)
-        self.hours_var = IntVar(self.canvas, value=hours)
-        self.minutes_var = IntVar(self.canvas, value=minutes)
+        self.name_var = StringVar(self.canvas)
+        self.hours_var = IntVar(self.canvas)
+        self.minutes_var = IntVar(self.canvas)
 
         # each time an entry is modified run the validation
-        self.name_var.trace_add("write", self.controller.validate_entries)
-        self.hours_var.trace_add("write", self.controller.validate_entries)
-        self.minutes_var.trace_add("write", self.controller.validate_entries)
+        # traced once for the life of the component, even when it is reused
+        self.name_var.trace_add("write", self.validate)
+        self.hours_var.trace_add("write", self.validate)
+        self.minutes_var.trace_add("write", self.validate)
 
         self.section_bg = round_rectangle(
             self.canvas, 0, 0, 600, 120, radius=12, fill="#F5F5F5", outline=""
@@ -170,7 +173,6 @@ class EditorSection:
             20,
             25,
             anchor="nw",
-            text=str(section_number),
             fill="#121212",
             font=HEADING[2],
         )
@@ -202,6 +204,35 @@ class EditorSection:
             350, 70, anchor="nw", text="m", fill="#121212", font=HEADING[3]
         )
 
+        self.bind(controller, section_number, name, hours, minutes)
+
+    def bind(self, controller, section_number, name="", hours=0, minutes=0):
+        """
+        Shows a section, used for new components and when one is reused
+        Arguments are the same as __init__()
+        """
+        # values will be populated if section already exists
+        # (without validating, the list may still be being built)
+        self.controller = None
+        self.name_var.set(name)
+        self.hours_var.set(hours)
+        self.minutes_var.set(minutes)
+        self.controller = controller
+
+        self.canvas.itemconfigure(self.section_number, text=str(section_number))
+        self.canvas.place(x=522.0, y=(96.0 + (138 * (section_number - 1))))
+
+    def validate(self, *args):
+        if self.controller:
+            self.controller.validate_entries()
+
+    def release(self):
+        self.controller = None
+        self.canvas.place_forget()
+
+    def destroy(self):
+        self.canvas.destroy()
+
 
 # add/remove section modification buttons
 class EditorSectionModify:
@@ -258,7 +289,7 @@ class EditorSectionModify:
 
 
 class EditorNewSubject:
-    def __init__(self, parent, callback):
+    def __init__(self, parent, callback, import_callback):
         """
         Initializes the UI component for adding a new subject
         (naming and selecting its level)
@@ -266,6 +297,7 @@ class EditorNewSubject:
         Args:
             parent (tkinter parent): A canvas housing all elements in EditorPage
             callback (function): EditorPage.create_subject()
+            import_callback (function): EditorPage.import_subjects()
         """
         self.parent = parent
         self.callback = callback
@@ -344,6 +376,13 @@ class EditorNewSubject:
         self.add_subject_button.place(
             x=self.x + 300, y=self.y + 142, width=100, height=47
         )
+        self.import_button = ttk.Button(
+            self.parent,
+            text="Import",
+            bootstyle="secondary",
+            command=lambda: import_callback(),
+        )
+        self.import_button.place(x=self.x + 190, y=self.y + 142, width=100, height=47)
 
     def set_level(self, level):
         """
@@ -372,14 +411,15 @@ class EditorNewSubject:
         self.reset_msg()
         self.callback(self.subject_name.strip(), self.level)
 
-    def status_msg(self, message):
+    def status_msg(self, message, fill="#FF0000"):
         """
         Shorthand function to display a status (error) message in red
 
         Args:
             message (string): Message to display
+            fill (string, optional): Colour of the message. Defaults to red.
         """
-        self.parent.itemconfig(self.add_subject_label, fill="#FF0000", text=message)
+        self.parent.itemconfig(self.add_subject_label, fill=fill, text=message)
 
     def reset_msg(self):
         """
@@ -400,8 +440,7 @@ class EditorSubjectList:
         rename_callback,
         remove_callback,
         level_callback,
-        subject_list,
-        active_subject_list,
+        subjects,
     ):
         """
         Initializes the UI component for selecting a subject to configure
@@ -412,8 +451,7 @@ class EditorSubjectList:
             rename_callback (function): EditorPage.rename_subject()
             remove_callback (function): EditorPage.remove_subject()
             level_callback (function): EditorPage.toggle_subject_level()
-            subject_list (list): List of subjects without active timers
-            active_subject_list (list): List of subjects with active timers
+            subjects (SubjectRegistry): every subject, with active timers or not
         """
         self.configure_callback = configure_callback
         self.rename_callback = rename_callback
@@ -443,8 +481,9 @@ class EditorSubjectList:
         self.listbox.bind("<<ListboxSelect>>", self.handle_selection)
 
         # populate list on init
-        self.subject_list = subject_list
-        self.active_subject_list = active_subject_list
+        self.subjects = subjects
+        self.rows: list[tuple] = []  # (timestamp, id) of each row, kept sorted
+        self.row_text: dict[int, str] = {}  # text shown for each subject ID
         self.update_list()
 
         self.remove_button = ttk.Button(
@@ -477,29 +516,130 @@ class EditorSubjectList:
     def update_list(self):
         """
         Called upon init to populate the list
-        Called by callback function when a new subject is added
+        Brings every row in line with the subjects, only rows that were added,
+        removed or renamed are touched
         """
+        current = {subject.id: subject for subject in self.subjects}
+
+        for subject_id in [row[1] for row in self.rows if row[1] not in current]:
+            self.delete_subject(subject_id)
 
-        self.listbox.delete(0, END)  # existing listbox cleared
+        for subject in current.values():
+            if subject.id in self.row_text:
+                self.refresh_subject(subject)
 
-        # Create dictionary mapping listbox indices to subject IDs
-        all_subjects = sorted(
-            self.subject_list + self.active_subject_list,
-            key=lambda subject: subject.timestamp,
+        self.insert_subjects(
+            [subject for subject in current.values() if subject.id not in self.row_text]
         )
 
-        self.subject_ids = {}
+    def insert_subject(self, subject):
+        """
+        Adds the row of a new subject in timestamp order
+        """
+        row = (subject.timestamp, subject.id)
+        index = bisect.bisect(self.rows, row)
+        self.rows.insert(index, row)
+        self.row_text[subject.id] = display_name(subject)
+
+        top = self.listbox.nearest(0)
+        self.listbox.insert(index, self.row_text[subject.id])
+        self.scroll_to(top + 1 if index < top else top)
+
+    def insert_subjects(self, subjects):
+        """
+        Adds the rows of several new subjects, e.g. imported ones, in timestamp
+        order. Rows that end up next to each other are inserted together and the
+        scroll position is restored once at the end.
+        """
+        if not subjects:
+            return
+
+        top = self.listbox.nearest(0)
+        start, texts = 0, []  # run of adjacent rows waiting to be inserted
+
+        # in order, so each row goes after the ones inserted before it
+        ordered = sorted(subjects, key=lambda subject: (subject.timestamp, subject.id))
+        for subject in ordered:
+            row = (subject.timestamp, subject.id)
+            index = bisect.bisect(self.rows, row)
+            self.rows.insert(index, row)
+            self.row_text[subject.id] = display_name(subject)
+
+            if texts and index != start + len(texts):
+                self.listbox.insert(start, *texts)
+                texts = []
+            if not texts:
+                start = index
+            texts.append(self.row_text[subject.id])
 
-        for index, subject in enumerate(all_subjects):
-            self.subject_ids[index] = subject.id
+            if index < top:
+                top += 1
 
-            display_name = f"{subject.name} {'HL' if subject.level == 1 else 'SL'}"
-            self.listbox.insert(END, display_name)
+        self.listbox.insert(start, *texts)
+        self.scroll_to(top)
+
+    def delete_subject(self, subject_id):
+        """
+        Removes the row of a subject
+        """
+        index = self.index_of(subject_id)
+        if index is None:
+            return
+
+        del self.rows[index]
+        del self.row_text[subject_id]
+
+        top = self.listbox.nearest(0)
+        self.listbox.delete(index)
+        self.scroll_to(top - 1 if index < top else top)
+
+    def refresh_subject(self, subject):
+        """
+        Rewrites the row of a renamed subject, keeping it selected if it was
+        """
+        text = display_name(subject)
+        index = self.index_of(subject.id)
+        if index is None or self.row_text[subject.id] == text:
+            return
+
+        self.row_text[subject.id] = text
+
+        top = self.listbox.nearest(0)
+        selected = self.listbox.selection_includes(index)
+        self.listbox.delete(index)
+        self.listbox.insert(index, text)
+        if selected:
+            self.listbox.selection_set(index)
+        self.scroll_to(top)
+
+    def index_of(self, subject_id):
+        """
+        Returns:
+            int | None: row of the subject, found by binary search on its timestamp
+        """
+        subject = self.subjects.get(subject_id)
+        if subject is not None:
+            index = bisect.bisect_left(self.rows, (subject.timestamp, subject_id))
+            if index < len(self.rows) and self.rows[index][1] == subject_id:
+                return index
+
+        # subject already removed from the registry, look for its ID
+        for index, row in enumerate(self.rows):
+            if row[1] == subject_id:
+                return index
+        return None
+
+    def scroll_to(self, top):
+        """
+        Restores the scroll position after rows above it were added or removed
+        """
+        if self.rows:
+            self.listbox.yview(max(0, top))
 
     @property
     def selected_id(self):
         selected_index = self.listbox.curselection()[0]
-        selected_id = self.subject_ids[selected_index]
+        selected_id = self.rows[selected_index][1]
         return selected_id
 
     def handle_selection(self, event):
@@ -523,3 +663,7 @@ class EditorSubjectList:
 
     def toggle_level(self):
         self.level_callback(self.selected_id)
+
+
+def display_name(subject):
+    return f"{subject.name} {'HL' if subject.level == 1 else 'SL'}"
@@ -0,0 +1,437 @@
+import datetime
+
+from clock import SystemClock
+from profiler import profiled
+from scheduler import ClockDriftDetector
+
+
+class TimerSession:
+    """
+    Headless state machine for one timer (one duration, group of subjects)
+    Holds all the timing logic, UI components subscribe to it to be redrawn.
+
+    Events passed to listeners:
+        start, tick, pause, resume, stop, finish, shift (displayed times moved),
+        remove (dropped from the TimerEngine, e.g. its subjects were deleted),
+        thirty_min and five_min (sent by alerts.AlertScheduler)
+    """
+
+    IDLE = "idle"
+    RUNNING = "running"
+    PAUSED = "paused"
+    FINISHED = "finished"
+
+    id_counter: int = 0
+
+    def __init__(
+        self, duration: datetime.timedelta, subjects: list, clock=None
+    ) -> None:
+        """
+        Args:
+            duration (datetime.timedelta): duration of the timer
+            subjects (list): list of Subject objs with the same duration
+            clock (SystemClock | SimulatedClock, optional): time source.
+            Defaults to the system clock.
+        """
+        self.duration = duration
+        self.subjects = subjects
+        self.clock = SystemClock() if clock is None else clock
+
+        self.id: int = TimerSession.id_counter
+        TimerSession.id_counter += 1
+
+        self.state = TimerSession.IDLE
+        self.listeners: list = []
+
+        self.elapsed = datetime.timedelta(0)
+        self.remaining = duration
+
+        # wall clock times, only used for display
+        self.start_time: datetime.datetime | None = None
+        self.end_time: datetime.datetime | None = None
+
+        # clock.monotonic() readings, used for all the arithmetic
+        self.start_monotonic = 0.0
+        self.paused_total = 0.0  # seconds spent paused
+        self.paused_at: float | None = None
+
+    def subscribe(self, listener):
+        """
+        Args:
+            listener (function): called as listener(event, session) on each event
+        """
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def notify(self, event: str):
+        for listener in list(self.listeners):
+            listener(event, self)
+
+    @property
+    def is_idle(self):
+        return self.state == TimerSession.IDLE
+
+    @property
+    def is_running(self):
+        return self.state == TimerSession.RUNNING
+
+    @property
+    def is_paused(self):
+        return self.state == TimerSession.PAUSED
+
+    @property
+    def finished(self):
+        return self.state == TimerSession.FINISHED
+
+    @property
+    def progress(self) -> float:
+        """
+        Fraction of the duration that has elapsed, between 0 and 1
+        """
+        return min(1.0, self.elapsed.total_seconds() / self.duration.total_seconds())
+
+    def start(self, now: float | None = None, wall: datetime.datetime | None = None):
+        """
+        Starts the timer, calculates the displayed start and end times
+
+        Args:
+            now (float, optional): clock.monotonic() reading
+            wall (datetime.datetime, optional): wall clock reading for display
+        """
+        self.start_monotonic = self.clock.monotonic() if now is None else now
+        self.paused_total = 0.0
+        self.paused_at = None
+
+        self.start_time = self.clock.now() if wall is None else wall
+        self.end_time = self.start_time + self.duration
+
+        self.state = TimerSession.RUNNING
+        self.notify("start")
+        self.tick(self.start_monotonic)
+
+    def restore(
+        self,
+        elapsed: float,
+        paused: bool,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+        now: float | None = None,
+    ):
+        """
+        Puts the timer back into a running or paused state, e.g. after a crash
+
+        Args:
+            elapsed (float): seconds of the timer that have already run
+            paused (bool): whether the timer was paused
+            start_time (datetime.datetime): displayed start time
+            end_time (datetime.datetime): displayed end time
+            now (float, optional): clock.monotonic() reading
+        """
+        if now is None:
+            now = self.clock.monotonic()
+
+        self.start_monotonic = now - elapsed
+        self.paused_total = 0.0
+        self.paused_at = now if paused else None
+
+        self.start_time = start_time
+        self.end_time = end_time
+
+        self.state = TimerSession.PAUSED if paused else TimerSession.RUNNING
+        self.notify("start")
+
+        if paused:
+            self.elapsed = datetime.timedelta(seconds=elapsed)
+            self.remaining = self.duration - self.elapsed
+            self.notify("pause")
+        else:
+            self.tick(now)
+
+    def pause(self, now: float | None = None):
+        if not self.is_running:
+            return
+
+        self.paused_at = self.clock.monotonic() if now is None else now
+        self.state = TimerSession.PAUSED
+        self.notify("pause")
+
+    def resume(self, now: float | None = None):
+        if not self.is_paused:
+            return
+
+        if now is None:
+            now = self.clock.monotonic()
+
+        pause_duration = now - self.paused_at
+        self.paused_total += pause_duration
+        self.paused_at = None
+
+        # the displayed end time moves back by however long the timer was paused
+        self.shift_end_time(datetime.timedelta(seconds=pause_duration))
+
+        self.state = TimerSession.RUNNING
+        self.notify("resume")
+        self.tick(now)
+
+    def stop(self):
+        """
+        Stops the timer and resets it back to its full duration
+        """
+        if self.state not in (TimerSession.RUNNING, TimerSession.PAUSED):
+            return
+
+        self.state = TimerSession.IDLE
+        self.paused_at = None
+        self.elapsed = datetime.timedelta(0)
+        self.remaining = self.duration
+        self.notify("stop")
+
+    def shift_end_time(self, offset: datetime.timedelta):
+        """
+        Moves the displayed start and end times by the given offset
+        Used when the timer is paused and when the wall clock is stepped (NTP, DST)
+
+        Args:
+            offset (datetime.timedelta): amount to move the times by
+        """
+        self.start_time += offset
+        self.end_time += offset
+        self.notify("shift")
+
+    def tick(self, now: float | None = None):
+        """
+        Calculates the elapsed and remaining time
+        If the timer is over, calls the finish() function
+
+        Args:
+            now (float, optional): clock.monotonic() reading shared by all timers
+            for this tick. Read from the clock if not given.
+        """
+        if not self.is_running:
+            return
+
+        if now is None:
+            now = self.clock.monotonic()
+
+        elapsed = now - self.start_monotonic - self.paused_total
+        remaining = self.duration.total_seconds() - elapsed
+
+        if remaining <= 1e-6:  # allow for float rounding at the exact end time
+            self.finish()
+        else:
+            self.elapsed = datetime.timedelta(seconds=elapsed)
+            self.remaining = datetime.timedelta(seconds=remaining)
+            self.notify("tick")
+
+    def elapsed_at(self, now: float | None = None) -> float:
+        """
+        Returns:
+            float: seconds of the timer that have run as of the given
+            clock.monotonic() reading (or now), excluding time spent paused
+        """
+        if self.is_idle:
+            return 0.0
+        if self.finished:
+            return self.duration.total_seconds()
+
+        if now is None:
+            now = self.clock.monotonic()
+        if self.is_paused:
+            now = self.paused_at
+
+        return now - self.start_monotonic - self.paused_total
+
+    def checkpoint(self) -> dict:
+        """
+        Returns:
+            dict: JSON serializable snapshot of the timer, enough to restore()
+            it later. The wall clock time is included so that time spent while
+            the app wasn't running can be added on.
+        """
+        return {
+            "session": self.id,
+            "state": self.state,
+            "subjects": [subject.id for subject in self.subjects],
+            "duration": self.duration.total_seconds(),
+            "elapsed": self.elapsed_at(),
+            "wall": self.clock.now().isoformat(),
+            "start_time": self.start_time.isoformat() if self.start_time else None,
+            "end_time": self.end_time.isoformat() if self.end_time else None,
+        }
+
+    @property
+    def end_monotonic(self) -> float:
+        """
+        clock.monotonic() reading at which the timer finishes, if it is running
+        """
+        return self.start_monotonic + self.paused_total + self.duration.total_seconds()
+
+    def milestones(self) -> list[tuple[float, str]]:
+        """
+        Returns:
+            list: (clock.monotonic() reading, event) of the 30min and 5min marks
+            (if applicable) and the end of the timer
+        """
+        end = self.end_monotonic
+        return [
+            (end - seconds, event)
+            for seconds, event in ((30 * 60, "thirty_min"), (5 * 60, "five_min"))
+            if self.duration.total_seconds() > seconds
+        ] + [(end, "end")]
+
+    def finish(self):
+        self.state = TimerSession.FINISHED
+        self.elapsed = self.duration
+        self.remaining = datetime.timedelta(0)
+        self.notify("finish")
+
+
+class TimerEngine:
+    """
+    Owns every TimerSession and ticks the running ones
+    Doesn't depend on tkinter, so it can be driven directly by tests and benchmarks.
+    """
+
+    def __init__(self, clock=None) -> None:
+        """
+        Args:
+            clock (SystemClock | SimulatedClock, optional): time source shared by
+            every session. Defaults to the system clock.
+        """
+        self.clock = SystemClock() if clock is None else clock
+        self.sessions: list[TimerSession] = []
+        self.listeners: list = []
+        self.drift_detector = ClockDriftDetector(self.clock)
+        self.profiler = None  # TickProfiler, set to time each session's tick
+
+    def subscribe(self, listener):
+        """
+        Subscribes a listener to the events of every session, current and future
+
+        Args:
+            listener (function): called as listener(event, session) on each event
+        """
+        self.listeners.append(listener)
+        for session in self.sessions:
+            session.subscribe(listener)
+
+    def create_session(self, duration: datetime.timedelta, subjects: list):
+        session = TimerSession(duration, subjects, self.clock)
+        for listener in self.listeners:
+            session.subscribe(listener)
+
+        self.sessions.append(session)
+        return session
+
+    def remove_session(self, session: TimerSession):
+        """
+        Drops a session, running or not, and tells the engine's listeners so
+        they can forget it (e.g. its queued alerts)
+        """
+        if session not in self.sessions:
+            return
+
+        self.sessions.remove(session)
+        session.notify("remove")
+        for listener in self.listeners:
+            session.unsubscribe(listener)
+
+    def start(self):
+        """
+        Starts every idle session with the same start time
+        """
+        now = self.clock.monotonic()
+        wall = self.clock.now()
+        self.drift_detector.reset()
+
+        for session in list(self.sessions):
+            if session.is_idle:
+                session.start(now, wall)
+
+    def pause(self):
+        now = self.clock.monotonic()
+        for session in self.sessions:
+            session.pause(now)
+
+    def resume(self):
+        now = self.clock.monotonic()
+        for session in list(self.sessions):
+            session.resume(now)
+
+    def stop(self):
+        for session in self.sessions:
+            session.stop()
+
+    def tick(self, now: float | None = None):
+        """
+        Advances every running session using a single monotonic clock reading
+
+        Args:
+            now (float, optional): clock.monotonic() reading for this tick
+        """
+        running = [session for session in self.sessions if session.is_running]
+        if not running:
+            return
+
+        if now is None:
+            now = self.clock.monotonic()
+
+        # keep displayed end times in line with the wall clock if it was stepped
+        shift = self.drift_detector.check(now)
+        if shift:
+            for session in self.sessions:
+                if session.is_running or session.is_paused:
+                    session.shift_end_time(datetime.timedelta(seconds=shift))
+
+        for session in running:
+            with profiled(self.profiler, f"timer {session.id}"):
+                session.tick(now)
+
+    def next_event(self, now: float | None = None) -> float | None:
+        """
+        Finds the next 30min mark, 5min mark or end of any running timer
+
+        Args:
+            now (float, optional): clock.monotonic() reading
+
+        Returns:
+            float | None: clock.monotonic() reading of the next event,
+            None if no timers are running
+        """
+        if now is None:
+            now = self.clock.monotonic()
+
+        upcoming = [
+            milestone
+            for session in self.sessions
+            if session.is_running
+            for milestone, _ in session.milestones()
+            if milestone > now
+        ]
+        return min(upcoming, default=None)
+
+    def in_final_minute(self, now: float | None = None) -> bool:
+        """
+        Returns:
+            bool: whether any running session has a minute or less left
+        """
+        if now is None:
+            now = self.clock.monotonic()
+
+        return any(
+            session.end_monotonic - now <= 60
+            for session in self.sessions
+            if session.is_running
+        )
+
+    def run_until_finished(self):
+        """
+        Jumps a SimulatedClock from event to event, ticking at each one,
+        until no timers are running. Replays an exam instantly, e.g. in CI.
+        """
+        while (event := self.next_event()) is not None:
+            self.clock.jump_to(event)
+            self.tick()
@@ -0,0 +1,141 @@
+# fixed width readouts for the big clock and timer numbers
+# each character gets its own canvas text item ("cell"), so a per-second update
+# only re-lays-out the digits that changed, and every digit cell is as wide as the
+# widest digit, so the readout doesn't shift sideways as the digits change
+
+# measured cell widths, (font, character) -> pixels, shared by every readout
+CELL_WIDTHS: dict = {}
+
+DIGITS = "0123456789"
+
+
+def cell_width(widget, font, char: str) -> int:
+    """
+    Width of the cell for a character, measured once per font
+    All digits share the width of the widest digit.
+
+    Args:
+        widget (tkinter widget): any widget, used to access Tk's font engine
+        font (str | tuple): font the character is drawn in
+        char (str): single character
+    """
+    if char.isdigit():
+        char = "0"
+
+    key = (font, char)
+    if key not in CELL_WIDTHS:
+        glyphs = DIGITS if char == "0" else char
+        CELL_WIDTHS[key] = max(
+            int(widget.tk.call("font", "measure", font, glyph)) for glyph in glyphs
+        )
+    return CELL_WIDTHS[key]
+
+
+class DigitReadout:
+    def __init__(
+        self, canvas, x, y, font, anchor: str = "w", fill="#121212", text="", tags=()
+    ) -> None:
+        """
+        A line of text drawn on a canvas one cell per character.
+        Used like a canvas text item, but set() only touches changed cells.
+
+        Args:
+            canvas (tkinter.Canvas): canvas to draw on
+            x (float): x position of the anchor
+            y (float): y position of the anchor
+            font (str | tuple): font of the text
+            anchor (str, optional): "w", "e", "nw" or "ne". Defaults to "w".
+            fill (str, optional): text colour. Defaults to "#121212".
+            text (str, optional): initial text. Defaults to "".
+            tags (tuple, optional): canvas tags given to every cell
+        """
+        self.canvas = canvas
+        self.x = x
+        self.y = y
+        self.font = font
+        self.anchor = anchor
+        self.fill = fill
+        self.tags = tags
+
+        self.cells: list[int] = []  # canvas text item of each character
+        self.widths: list[int] = []  # width of each cell as laid out
+        self.text = ""
+
+        self.set(text)
+
+    def set(self, text: str):
+        """
+        Shows new text, only cells whose character changed are redrawn
+        """
+        if text == self.text:
+            return
+
+        widths = [cell_width(self.canvas, self.font, char) for char in text]
+        if widths != self.widths:
+            self.layout(widths)
+            previous = ""  # cells were moved or recreated, redraw them all
+        else:
+            previous = self.text
+
+        for index, char in enumerate(text):
+            if index >= len(previous) or previous[index] != char:
+                self.canvas.itemconfigure(self.cells[index], text=char)
+
+        self.text = text
+
+    def layout(self, widths: list[int]):
+        """
+        Creates or deletes cells to match the number of characters, then places
+        each cell centred in its slot
+        """
+        while len(self.cells) > len(widths):
+            self.canvas.delete(self.cells.pop())
+
+        # cells are anchored at their top, middle or bottom centre
+        cell_anchor = {"n": "n", "s": "s"}.get(self.anchor[0], "center")
+        while len(self.cells) < len(widths):
+            self.cells.append(
+                self.canvas.create_text(
+                    0,
+                    0,
+                    anchor=cell_anchor,
+                    fill=self.fill,
+                    font=self.font,
+                    tags=self.tags,
+                )
+            )
+
+        left = self.x - sum(widths) if self.anchor.endswith("e") else self.x
+        for cell, width in zip(self.cells, widths):
+            self.canvas.coords(cell, left + width / 2, self.y)
+            left += width
+
+        self.widths = widths
+
+    def move_to(self, x, y):
+        """
+        Moves the anchor of the readout
+        """
+        self.x = x
+        self.y = y
+        self.layout(self.widths)
+
+    def configure(self, fill=None, font=None):
+        """
+        Changes the colour or font of every cell
+
+        Args:
+            fill (str, optional): text colour
+            font (str | tuple, optional): font, the cells are re-measured
+        """
+        if fill is not None:
+            self.fill = fill
+        if font is not None:
+            self.font = font
+
+        for cell in self.cells:
+            self.canvas.itemconfigure(cell, fill=self.fill, font=self.font)
+
+        if font is not None:
+            text, self.text, self.widths = self.text, "", []
+            self.set(text)
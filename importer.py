@@ -0,0 +1,183 @@
+import csv
+import json
+import os
+
+FIELDS = ("subject", "level", "section", "hours", "minutes")
+LEVELS = {"SL": 0, "HL": 1, "0": 0, "1": 1}
+MAX_SECTIONS = 4  # same limit as the editor
+
+
+class RowError(str):
+    """
+    Yielded in place of a row that couldn't be decoded, says what is wrong
+    """
+
+
+def iter_csv(file):
+    """
+    Yields (row number, row dict) for each row of a CSV schedule with a header
+    """
+    reader = csv.DictReader(file)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def iter_json_lines(file):
+    """
+    Yields (line number, row dict) for each line of a JSON lines schedule
+    A line that isn't valid JSON is yielded as a RowError, the rest are still read.
+    """
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            row = RowError("invalid JSON")
+        yield line_number, row
+
+
+def iter_json_array(file, chunk_size: int = 65536):
+    """
+    Yields (index, row dict) for each object of a JSON array schedule
+    The file is decoded incrementally, one object at a time, instead of being
+    loaded as a whole.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    started = False
+    index = 0
+
+    while True:
+        chunk = file.read(chunk_size)
+        buffer = buffer[position:] + chunk
+        position = 0
+
+        while True:
+            # skip whitespace, the opening bracket and commas between objects
+            while position < len(buffer) and buffer[position] in " \t\r\n,[":
+                if buffer[position] == "[":
+                    started = True
+                position += 1
+
+            if position < len(buffer) and buffer[position] == "]":
+                return
+
+            try:
+                row, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break  # object continues in the next chunk
+
+            if not started:
+                raise ValueError("expected a JSON array of objects")
+
+            index += 1
+            yield index, row
+            position = end
+
+        if not chunk:
+            if buffer[position:].strip():
+                raise ValueError("unexpected end of JSON array")
+            return
+
+
+def read_schedule(path: str, existing: set | None = None) -> tuple[list, list]:
+    """
+    Reads a schedule of subjects and sections from a CSV, JSON or JSON lines file.
+    Every row is one section: subject, level (HL/SL), section, hours, minutes.
+    Rows with the same subject and level become sections of one subject, in order.
+
+    All rows are validated in a single pass, so every problem is reported at once.
+
+    Args:
+        path (str): path of a .csv, .json or .jsonl file
+        existing (set, optional): (name, level) of subjects that already exist
+
+    Returns:
+        tuple: (subjects, errors), where subjects is a list of dicts with name,
+        level and sections (list of (name, hours, minutes) tuples) and errors is
+        a list of messages with the row they refer to
+    """
+    existing = existing or set()
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".csv":
+        rows_from = iter_csv
+    elif extension == ".jsonl":
+        rows_from = iter_json_lines
+    elif extension == ".json":
+        rows_from = iter_json_array
+    else:
+        return [], [f"Unsupported file type: {extension or path}"]
+
+    subjects: dict[tuple[str, int], dict] = {}
+    errors: list[str] = []
+
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        try:
+            for row_number, row in rows_from(file):
+                error = add_row(subjects, existing, row)
+                if error:
+                    errors.append(f"Row {row_number}: {error}")
+        except (ValueError, csv.Error) as exception:
+            errors.append(f"Could not read file: {exception}")
+
+    return list(subjects.values()), errors
+
+
+def add_row(subjects: dict, existing: set, row) -> str | None:
+    """
+    Validates a single row and adds it to the subjects being built
+
+    Returns:
+        str | None: what is wrong with the row, None if it was added
+    """
+    if isinstance(row, RowError):
+        return row
+    if not isinstance(row, dict):
+        return "expected an object with " + ", ".join(FIELDS)
+
+    missing = [field for field in FIELDS if row.get(field) in (None, "")]
+    if missing:
+        return "missing " + ", ".join(missing)
+
+    name = str(row["subject"]).strip()
+    section_name = str(row["section"]).strip()
+    level = LEVELS.get(str(row["level"]).strip().upper())
+
+    if not name or not section_name:
+        return "subject and section names can't be blank"
+    if level is None:
+        return f"level must be HL or SL, not {row['level']!r}"
+
+    # JSON true/false and fractions would otherwise be turned into whole numbers
+    for value in (row["hours"], row["minutes"]):
+        if isinstance(value, bool) or (
+            isinstance(value, float) and not value.is_integer()
+        ):
+            return "hours and minutes must be whole numbers"
+
+    try:
+        hours = int(row["hours"])
+        minutes = int(row["minutes"])
+    except (TypeError, ValueError):
+        return "hours and minutes must be whole numbers"
+
+    if hours < 0 or not 0 <= minutes < 60:
+        return "hours must be 0 or more and minutes between 0 and 59"
+    if hours + minutes == 0:
+        return "section must be at least 1 minute long"
+
+    if (name, level) in existing:
+        return f"{name} {'HL' if level else 'SL'} already exists"
+
+    subject = subjects.setdefault(
+        (name, level), {"name": name, "level": level, "sections": []}
+    )
+    if len(subject["sections"]) >= MAX_SECTIONS:
+        return f"{name} already has {MAX_SECTIONS} sections"
+
+    subject["sections"].append((section_name, hours, minutes))
+    return None
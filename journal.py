@@ -0,0 +1,147 @@
+import json
+import logging
+import os
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class Journal:
+    def __init__(self, path: str, interval: float = 0.5) -> None:
+        """
+        Append-only journal of subject edits and timer transitions, one JSON
+        object per line. Lines are written and fsync'd in batches by a background
+        thread so that recording never blocks the Tk main loop.
+
+        Records:
+            {"type": "subject", ...}: full details of a new or edited subject
+            {"type": "subject_remove", "id": ...}: a subject was removed
+            {"type": "timer", ...}: checkpoint of a timer after a transition
+
+        Args:
+            path (str): path of the journal file, created if it doesn't exist
+            interval (float, optional): seconds to wait between batches, so that
+            bursts of records share one fsync. Defaults to 0.5.
+        """
+        self.path = path
+        self.interval = interval
+
+        self.queue: queue.Queue = queue.Queue()
+        self.thread: threading.Thread | None = None
+
+    def start(self):
+        """
+        Starts the background writer thread
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self.thread = threading.Thread(target=self.write_loop, daemon=True)
+        self.thread.start()
+
+    def record(self, record_type: str, **data):
+        """
+        Queues a record to be written, returns immediately
+
+        Args:
+            record_type (str): "subject", "subject_remove" or "timer"
+            **data: JSON serializable contents of the record
+        """
+        self.queue.put({"type": record_type, **data})
+
+    def close(self):
+        """
+        Writes any queued records and stops the writer thread
+        """
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def write_loop(self):
+        """
+        Runs on the writer thread.
+        Waits for a record, then writes everything queued so far with one fsync.
+        """
+        with open(self.path, "a", encoding="utf-8") as file:
+            while True:
+                batch = [self.queue.get()]
+                while True:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                closing = None in batch
+                lines = [json.dumps(record) + "\n" for record in batch if record]
+
+                try:
+                    file.writelines(lines)
+                    file.flush()
+                    os.fsync(file.fileno())
+                except OSError:
+                    logger.exception("Could not write to journal %s", self.path)
+
+                if closing:
+                    return
+
+                # let records pile up a little so they share the next fsync
+                threading.Event().wait(self.interval)
+
+    def compact(self, records: list[dict]):
+        """
+        Replaces the journal with a snapshot of the current state
+        Must be called before start(), e.g. straight after recovery.
+
+        Args:
+            records (list): full list of records describing the current state
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.writelines(json.dumps(record) + "\n" for record in records)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, self.path)
+
+    @staticmethod
+    def replay(path: str) -> tuple[dict, dict]:
+        """
+        Reads a journal back to rebuild the state it describes
+        A truncated last line (crash mid-write) is skipped.
+
+        Args:
+            path (str): path of the journal file
+
+        Returns:
+            tuple: (subjects, timers), the latest "subject" record for each
+            subject ID and the latest "timer" record for each timer that was
+            still running or paused
+        """
+        subjects: dict[int, dict] = {}
+        timers: dict[int, dict] = {}
+
+        if not os.path.exists(path):
+            return subjects, timers
+
+        with open(path, encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping corrupt journal line %d", line_number)
+                    continue
+
+                if record["type"] == "subject":
+                    subjects[record["id"]] = record
+                elif record["type"] == "subject_remove":
+                    subjects.pop(record["id"], None)
+                elif record["type"] == "timer":
+                    if record["state"] in ("running", "paused"):
+                        timers[record["session"]] = record
+                    else:
+                        timers.pop(record["session"], None)
+
+        return subjects, timers
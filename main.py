@@ -1,88 +1,308 @@
-import tkinter as tk
-import tkinter.simpledialog as simpledialog
-from collections import defaultdict
-from datetime import timedelta
-
-import arrow
-import ttkbootstrap as ttk
-
-from editor import EditorNewSubject, EditorSubjectList, EditorSectionList
-from timer import Timer
-
-
-class Subject:
-    """
-    Represents an IB subject which may contain multiple papers.
-    """
-
-    id_counter: int = 0
-
-    def __init__(self, name: str, level: int) -> None:
-        self.name: str = name
-        self.level: int = level  # 0 for SL, 1 for HL
-        self.sections: list[Section] = []
-
-        self.id: int = Subject.id_counter
-        Subject.id_counter += 1
-
-        self.timestamp: arrow.Arrow = arrow.now()
-
-
-class Section:
-    """
-    Represents a single section (paper) of a subject, e.g. Paper 1 of a subject.
-    """
-
-    id_counter: int = 0
-
-    def __init__(self, name: str, hours: int, minutes: int) -> None:
-        """
-        Initializes a new section.
-        """
-        self.name: str = name
-        self.hours: int = hours
-        self.minutes: int = minutes
-
-        self.section_in_progress: bool = False
-        self.section_run: bool = False
-
-        self.id: int = Section.id_counter
-        Section.id_counter += 1
+import time
+
+# taken before the other imports, the startup report includes the time spent
+# importing ttkbootstrap and the rest of the app
+STARTED = time.perf_counter()
+
+# pylint: disable=wrong-import-position
+import logging  # noqa: E402
+import math  # noqa: E402
+import os  # noqa: E402
+import sys  # noqa: E402
+import tkinter as tk  # noqa: E402
+from collections import defaultdict  # noqa: E402
+from datetime import datetime, timedelta  # noqa: E402
+
+import ttkbootstrap as ttk  # noqa: E402
+
+from alerts import AlertScheduler  # noqa: E402
+from clock import SimulatedClock, SystemClock  # noqa: E402
+from diagnostics import LeakDetector  # noqa: E402
+from journal import Journal  # noqa: E402
+from model import Section, Subject, SubjectRegistry  # noqa: E402
+from pool import WidgetPool, pool_stats  # noqa: E402
+from profiler import TickProfiler  # noqa: E402
+from render import ProgressAnimator, RenderQueue  # noqa: E402
+from engine import TimerEngine  # noqa: E402
+from glyphs import DigitReadout  # noqa: E402
+from style import (  # noqa: E402
+    BASE_HEIGHT,
+    BASE_WIDTH,
+    HEADING,
+    TIMER_HEIGHT,
+    TIMER_WIDTH,
+)
+from scheduler import AfterHandle, TickScheduler  # noqa: E402
+from timer import Timer  # noqa: E402
+from canvas_timer import CanvasTimer  # noqa: E402
+# pylint: enable=wrong-import-position
 
 
 class App(tk.Tk):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        clock=None,
+        journal: Journal | None = None,
+        profiler: TickProfiler | None = None,
+        profile_path: str | None = None,
+    ) -> None:
         """
         Initializes the main app UI (showing the clock and timer page by default)
         Initializes base data structures
+
+        Args:
+            clock (SystemClock | SimulatedClock, optional): time source for the
+            header clock and every timer. Defaults to the system clock.
+            journal (Journal, optional): journal to recover the last session from
+            and record this one to. Nothing is saved if not given.
+            profiler (TickProfiler, optional): records the lag and duration of
+            every tick and shows them in a debug overlay (F12 to hide/show)
+            profile_path (str, optional): file the profiler dumps to on Ctrl+D
+            and when the app is closed
         """
 
-        # FIXME: resizing breaks the border (clockheader)
+        self.clock = SystemClock() if clock is None else clock
+        self.journal = journal
+        self.profiler = profiler
+        self.profile_path = profile_path
 
-        self.subjects: list[Subject] = []
-        self.active_subjects: list[Subject] = []
+        self.subjects = SubjectRegistry()
 
         # debug
-        # self.subjects.append(Subject("English", 0))
-        # self.subjects[0].sections.append(Section("Paper 1", 0, 1))
+        # self.add_subject(Subject("English", 0))
+        # self.get_subject(0).sections.append(Section("Paper 1", 0, 1))
 
         self.root = ttk.Window(themename="robin")
         self.root.title("NIST Exam Clock")
         self.root.geometry("1920x1080")
         self.root.minsize(560, 1)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+        # the layout is recomputed once a resize has settled, not on every event
+        self.resize_handle = AfterHandle(self.root)
+        self.scale = 1.0
+        self.root.bind("<Configure>", self.on_configure)
+
+        # set EXAM_CLOCK_DIAGNOSTICS to log widgets, after() callbacks and traces
+        # that pile up between presses of "Next" and between editor sessions
+        self.leak_detector = (
+            LeakDetector(self.root)
+            if os.environ.get("EXAM_CLOCK_DIAGNOSTICS")
+            else None
+        )
 
         container = ttk.Frame(self.root, height=900, width=1600)
         container.pack(side="top", fill="both", expand=True)
         
-        self.header = ClockHeader(container, self)
+        # set EXAM_CLOCK_TENTHS to show tenths of a second in a timer's last minute
+        self.header = ClockHeader(
+            container, self, show_tenths=bool(os.environ.get("EXAM_CLOCK_TENTHS"))
+        )
         self.header.grid(row=0, column=0, sticky="nsew")
         container.grid_rowconfigure(0, weight=0)  # make the header row not resizable
         container.grid_columnconfigure(0, weight=1)  # make the column resizable
 
-        self.timer_page = TimerPage(container, self)
+        # timers that don't fit are paged, EXAM_CLOCK_PAGE_SECONDS sets how long
+        # each page is shown for (0 to only change pages with Page Up/Down)
+        # set EXAM_CLOCK_SINGLE_CANVAS to draw every timer on one canvas
+        # set EXAM_CLOCK_ANIMATION_FPS to move the progressbars smoothly, until
+        # frames take over EXAM_CLOCK_ANIMATION_BUDGET ms (default 8) on average
+        self.timer_page = TimerPage(
+            container,
+            self,
+            page_seconds=int(os.environ.get("EXAM_CLOCK_PAGE_SECONDS", 15)),
+            single_canvas=bool(os.environ.get("EXAM_CLOCK_SINGLE_CANVAS")),
+            animation_fps=int(os.environ.get("EXAM_CLOCK_ANIMATION_FPS", 0)),
+            animation_budget=float(os.environ.get("EXAM_CLOCK_ANIMATION_BUDGET", 8)),
+        )
         self.timer_page.grid(row=1, column=0, sticky="nsew", padx=0, pady=0)
         container.grid_rowconfigure(1, weight=1)
 
+        # one callback per second drives the header clock and every running timer
+        self.scheduler = TickScheduler(self.root, self.clock)
+        self.scheduler.subscribe(self.header.update_clock)
+        self.scheduler.subscribe(self.timer_page.tick)
+        self.scheduler.start()
+
+        # 30min/5min warnings and timer ends fire at the exact instant they're due
+        # set EXAM_CLOCK_BELL to ring the system bell with each of them
+        self.alerts = AlertScheduler(
+            self.root,
+            self.clock,
+            sound=(lambda event, session: self.root.bell())
+            if os.environ.get("EXAM_CLOCK_BELL")
+            else None,
+        )
+        self.timer_page.engine.subscribe(self.alerts.handle_event)
+
+        self.root.bind("<Prior>", lambda event: self.timer_page.turn_page(-1))
+        self.root.bind("<Next>", lambda event: self.timer_page.turn_page(1))
+
+        # with a simulated clock, Ctrl+J skips to the next 30min/5min mark or end
+        if isinstance(self.clock, SimulatedClock):
+            self.root.bind("<Control-j>", lambda event: self.skip_to_next_event())
+
+        if self.profiler:
+            self.scheduler.profiler = self.profiler
+            self.timer_page.engine.profiler = self.profiler
+            self.timer_page.renderer.profiler = self.profiler
+
+            self.overlay = DebugOverlay(
+                self.root, self.profiler, self.timer_page.animator
+            )
+            self.scheduler.subscribe(self.overlay.update_stats)
+            self.root.bind("<F12>", lambda event: self.overlay.toggle())
+            self.root.bind("<Control-d>", lambda event: self.dump_profile())
+
+        if self.journal:
+            self.recover()
+
+    def recover(self):
+        """
+        Rebuilds the subjects and running/paused timers recorded in the journal,
+        then starts recording the current session to it
+        """
+        subject_records, timer_records = Journal.replay(self.journal.path)
+
+        for record in subject_records.values():
+            subject = Subject(record["name"], record["level"])
+            subject.id = record["id"]
+            subject.timestamp = datetime.fromisoformat(record["timestamp"])
+
+            for section_record in record["sections"]:
+                section = Section(
+                    section_record["name"],
+                    section_record["hours"],
+                    section_record["minutes"],
+                )
+                section.section_run = section_record["run"]
+                subject.sections.append(section)
+
+            self.subjects.add(subject)
+            Subject.id_counter = max(Subject.id_counter, subject.id + 1)
+
+        # timer checkpoints are journaled again as the timers are restored
+        self.timer_page.engine.subscribe(self.record_timer)
+
+        for record in timer_records.values():
+            self.timer_page.restore_timer(record)
+
+        for subject in self.subjects:
+            self.timer_page.mark_dirty(subject.id)
+        self.timer_page.group_timers()
+        self.timer_page.draw_timers()
+
+        if timer_records:
+            states = [record["state"] for record in timer_records.values()]
+            self.header.set_running(paused="running" not in states)
+
+        # replace the old journal with a snapshot, then record from there on
+        self.journal.compact(
+            [self.subject_record(subject) for subject in self.subjects]
+        )
+        self.journal.start()
+
+    def subject_record(self, subject: Subject) -> dict:
+        """
+        Returns:
+            dict: journal record with the full details of a subject
+        """
+        return {
+            "type": "subject",
+            "id": subject.id,
+            "name": subject.name,
+            "level": subject.level,
+            "timestamp": subject.timestamp.isoformat(),
+            "sections": [
+                {
+                    "name": section.name,
+                    "hours": section.hours,
+                    "minutes": section.minutes,
+                    "run": section.section_run,
+                }
+                for section in subject.sections
+            ],
+        }
+
+    def record_subject(self, subject: Subject):
+        """
+        Journals the current details of a subject, called after every edit
+        """
+        if self.journal:
+            self.journal.record(**self.subject_record(subject))
+
+    def record_timer(self, event, session):
+        """
+        Journals a checkpoint of a timer after each transition (not every tick)
+        A removed timer is journaled as such, so it isn't restored after a crash.
+        """
+        if self.journal and event != "tick":
+            checkpoint = session.checkpoint()
+            if event == "remove":
+                checkpoint["state"] = "removed"
+            self.journal.record("timer", **checkpoint)
+
+    def dump_profile(self):
+        """
+        Writes the tick profile to profile_path, if profiling is on
+        """
+        if self.profiler and self.profile_path:
+            self.profiler.dump(
+                self.profile_path,
+                pools=pool_stats(),
+                after_callbacks=AfterHandle.outstanding,
+                animation=(
+                    self.timer_page.animator.stats()
+                    if self.timer_page.animator
+                    else None
+                ),
+            )
+            logging.info("Tick profile written to %s", self.profile_path)
+
+    def close(self):
+        """
+        Flushes the journal (and tick profile) before the window is closed
+        """
+        if self.journal:
+            self.journal.close()
+        self.dump_profile()
+        self.root.destroy()
+
+    def check_leaks(self, cycle: str):
+        """
+        Logs anything that grew since the last cycle, in diagnostics mode
+
+        Args:
+            cycle (str): what was just done, "next" or "editor"
+        """
+        if self.leak_detector:
+            self.leak_detector.check(cycle)
+
+    def on_configure(self, event):
+        """
+        Debounces resizing of the main window, every <Configure> event during a
+        drag pushes the layout back until the size has been still for 150ms
+        """
+        if event.widget is not self.root:
+            return  # the root binding also sees every child widget's events
+
+        self.resize_handle.schedule(150, self.apply_layout)
+
+    def apply_layout(self):
+        """
+        Scales the header and timers to the window size and rewraps the timers
+        """
+        scale = min(
+            self.root.winfo_width() / BASE_WIDTH,
+            self.root.winfo_height() / BASE_HEIGHT,
+        )
+        scale = max(0.4, min(2.0, round(scale * 20) / 20))  # 5% steps
+
+        if scale != self.scale:
+            self.scale = scale
+            self.header.set_scale(scale)
+        self.timer_page.update_layout(scale)
+
     def create_new_window(
         self, frame_class, width: int = 1520, height: int = 760
     ) -> None:
@@ -98,41 +318,138 @@ class App(tk.Tk):
         popup.geometry(f"{width}x{height}")
         frame_class(popup, self)
 
+    def skip_to_next_event(self):
+        """
+        Jumps the simulated clock to the next event of any running timer
+        """
+        event = self.timer_page.engine.next_event()
+        if event is not None:
+            self.clock.jump_to(event)
+            self.alerts.fire()
+            self.scheduler.tick()
+
+    def add_subject(self, subject: Subject):
+        """
+        Stores a new subject
+        """
+        self.subjects.add(subject)
+        self.record_subject(subject)
+
+    def remove_subject(self, subject_id: int):
+        """
+        Removes the subject with the given ID, whatever its state
+        """
+        self.subjects.remove(subject_id)
+        if self.journal:
+            self.journal.record("subject_remove", id=subject_id)
+
     def get_subject(self, requested_id: int) -> Subject | None:
         """
         Returns the subject that has the given ID.
         """
+        return self.subjects.get(requested_id)
 
-        for subject in self.subjects + self.active_subjects:
-            if subject.id == requested_id:
-                return subject
 
-        return None
+class DebugOverlay(ttk.Label):
+    def __init__(
+        self,
+        parent,
+        profiler: TickProfiler,
+        animator: ProgressAnimator | None = None,
+    ) -> None:
+        """
+        Small label in the bottom left corner showing the tick lag, jitter and
+        update time recorded by the profiler, the number of pending after()
+        callbacks, the progressbar animation's frame cost and the widget pool
+        counters, refreshed once per tick
+        """
+        ttk.Label.__init__(
+            self,
+            parent,
+            font=("Courier", 10),
+            background="#121212",
+            foreground="#EEEEEE",
+            padding=4,
+        )
+        self.profiler = profiler
+        self.profiler.overhead.add(self.update_stats.__qualname__)
+        self.animator = animator
+        self.visible = False
+        self.toggle()
+
+    def toggle(self):
+        self.visible = not self.visible
+        if self.visible:
+            self.place(relx=0, rely=1, anchor="sw")
+        else:
+            self.place_forget()
+
+    def update_stats(self):
+        if not self.visible:
+            return
+
+        stats = self.profiler.stats()
+        lines = [
+            f"lag p50 {stats['lag_p50_ms']:.1f}ms "
+            f"p99 {stats['lag_p99_ms']:.1f}ms  "
+            f"jitter {stats['jitter_max_ms']:.1f}ms  "
+            f"update p99 {stats['update_p99_ms']:.1f}ms  "
+            f"({stats['ticks']} ticks)"
+        ]
+        lines.append(f"after callbacks pending: {AfterHandle.outstanding}")
+        if self.animator:
+            animation = self.animator.stats()
+            lines.append(
+                f"animation: {animation['bars']} bars  "
+                f"{animation['frame_ms']:.1f}ms/frame  "
+                + (
+                    "off, over budget"
+                    if animation["fallen_back"]
+                    else f"{animation['fps']} fps"
+                )
+            )
+        for name, counters in sorted(pool_stats().items()):
+            lines.append(
+                f"{name} pool: {counters['free']} free  "
+                f"{counters['hit_rate']:.0%} hits "
+                f"({counters['hits']}/{counters['hits'] + counters['misses']})"
+            )
+        self.configure(text="\n".join(lines))
 
 
 # TODO: add custom start (choose subjects to start)
 class ClockHeader(ttk.Frame):
-    def __init__(self, parent, controller) -> None:
+    def __init__(self, parent, controller, show_tenths: bool = False) -> None:
         """
         Initializes the UI for the header of the exam clock
         Shows the time and buttons to start/stop/edit exams
+
+        Args:
+            show_tenths (bool, optional): show tenths of a second while any timer
+            is in its final minute. Defaults to False.
         """
         self.controller = controller
+        self.show_tenths = show_tenths
+        self.displayed_time = ""  # text currently drawn, to skip identical redraws
         ttk.Frame.__init__(self, parent)
+        self.tenths_handle = AfterHandle(self)
 
-        self.clock_canvas = ttk.Canvas(self, height=80, width=1920)
+        # the canvas follows the width of the window, a fixed width (and the
+        # highlight border) was cut off on the right when the window was narrower
+        self.clock_canvas = ttk.Canvas(self, height=80, highlightthickness=0)
         self.clock_canvas.pack(expand=True, fill="both")
         self.clock_canvas.configure(background="#EEEEEE")
 
-        self.clock_text = self.clock_canvas.create_text(
+        # fixed width digits, only the digits that change are redrawn
+        self.clock_text = DigitReadout(
+            self.clock_canvas,
             20.0,
             40.0,
+            ("SF Pro Display Bold", 50),
             anchor="w",
             text="00:00:00",
-            fill="#121212",
-            font=("SF Pro Display Bold", 50),
         )
-        self.update_clock()
+        self.draw_time(self.controller.clock.now().strftime("%H:%M:%S"))
 
         # initialize style
         s = ttk.Style()
@@ -181,7 +498,7 @@ class ClockHeader(ttk.Frame):
             ttk.Button(
                 self.button_frame,
                 text="Next",
-                command=lambda: self.controller.timer_page.advance_timers(),
+                command=lambda: self.on_next_button_click(),
                 bootstyle="secondary",
                 state="disabled",
             ),
@@ -227,19 +544,104 @@ class ClockHeader(ttk.Frame):
         self.update_buttons()
         self.controller.timer_page.stop_timers()
 
+    def on_next_button_click(self):
+        self.buttons[5]['state'] = 'disabled'  # Disable the "Next" button
+        self.buttons[1]['state'] = 'normal'  # Enable the "Start" button
+        self.update_buttons()
+        self.controller.timer_page.advance_timers()
+        self.controller.check_leaks("next")
+
+    def set_running(self, paused: bool):
+        """
+        Sets the buttons as if Start (and Pause) had been clicked
+        Called after timers are recovered from the journal
+        """
+        self.buttons[1]['state'] = 'disabled'  # Disable the "Start" button
+        self.buttons[2]['state'] = 'disabled' if paused else 'normal'  # "Pause"
+        self.buttons[3]['state'] = 'normal' if paused else 'disabled'  # "Resume"
+        self.buttons[4]['state'] = 'normal'  # Enable the "Stop" button
+        self.update_buttons()
+
+    def enable_next_button(self):
+        """
+        Called by TimerPage.finish() once a timer is done
+        """
+        self.buttons[5]['state'] = 'normal'  # Enable the "Next" button
+        self.update_buttons()
+
     def update_clock(self) -> None:
         """
-        Updates the clock time. Continuously called to update each second.
+        Updates the clock time. Called by App.scheduler at the start of each second.
+        """
+        if self.tenths_handle.pending:
+            return  # update_tenths() is drawing the clock
+
+        self.draw_time(self.controller.clock.now().strftime("%H:%M:%S"))
+
+        if self.show_tenths and self.controller.timer_page.engine.in_final_minute():
+            self.update_tenths()
+
+    def update_tenths(self):
+        """
+        Draws the clock with tenths of a second, aligned to each tenth,
+        for as long as any timer is in its final minute
         """
-        time: str = arrow.now().format("HH:mm:ss")
-        self.clock_canvas.itemconfig(self.clock_text, text=time)
-        self.after(1000, self.update_clock)
+        clock = self.controller.clock
+        now = clock.now()
+
+        if not self.controller.timer_page.engine.in_final_minute():
+            self.draw_time(now.strftime("%H:%M:%S"))
+            return
+
+        self.draw_time(now.strftime("%H:%M:%S.") + str(now.microsecond // 100000))
+
+        delay = math.ceil(clock.until_next(0.1) * 1000) + 1
+        self.tenths_handle.schedule(delay, self.update_tenths)
+
+    def set_scale(self, scale: float):
+        """
+        Resizes the header and clock, called by App.apply_layout()
+        """
+        self.clock_canvas.configure(height=round(80 * scale))
+        self.clock_text.configure(font=("SF Pro Display Bold", round(50 * scale)))
+        self.clock_text.move_to(round(20 * scale), round(40 * scale))
+
+    def draw_time(self, text: str):
+        """
+        Sets the clock text, unless it is already showing that text
+        """
+        if text != self.displayed_time:
+            self.displayed_time = text
+            self.clock_text.set(text)
 
 
 class TimerPage(ttk.Frame):
-    def __init__(self, parent: ttk.Frame, controller: App):
+    def __init__(
+        self,
+        parent: ttk.Frame,
+        controller: App,
+        page_seconds: int = 15,
+        single_canvas: bool = False,
+        animation_fps: int = 0,
+        animation_budget: float = 8.0,
+    ):
         """
         Initializes the UI for the timer page, which shows the current exam timers
+        Timers are wrapped into as many rows and columns as fit, any more are
+        split into pages that are cycled through.
+
+        Args:
+            page_seconds (int, optional): seconds each page is shown for when
+            there is more than one, 0 to never turn pages automatically.
+            Defaults to 15.
+            single_canvas (bool, optional): draw every timer as items on one
+            canvas (CanvasTimer) instead of with widgets of its own (Timer).
+            Defaults to False.
+            animation_fps (int, optional): frames per second to move the
+            progressbars at between ticks, 0 to only move them once per tick.
+            Defaults to 0.
+            animation_budget (float, optional): average ms a frame may take
+            before animation is turned off. Defaults to 8.
         """
 
         # TODO: separation between timers (white and grey)
@@ -247,65 +649,251 @@ class TimerPage(ttk.Frame):
         ttk.Frame.__init__(self, parent, padding=20)
 
         self.controller: App = controller
+
+        # layout, updated from the size of the page
+        self.columns = 1
+        self.rows = 1
+        self.page = 0
+        self.page_seconds = page_seconds
+        self.seconds_on_page = 0
+
+        # in single canvas mode the timers are laid out in fixed size cells
+        self.canvas = None
+        if single_canvas:
+            self.canvas = ttk.Canvas(self, highlightthickness=0)
+            self.canvas.grid(row=0, column=0, sticky="nsew")
+            self.grid_columnconfigure(0, weight=1)
+
+        self.page_label = ttk.Label(self, font=HEADING[4], foreground="#838383")
         self.grid_rowconfigure(0, weight=1)
+        self.scale = 1.0
 
         self.timers: list[Timer] = []
+        self.timers_by_subject_id: dict[int, Timer] = {}
+        self.dirty_subject_ids: dict[int, None] = {}  # ordered set
+        self.engine = TimerEngine(controller.clock)
+        self.renderer = RenderQueue(self)  # one batched redraw of all timers per tick
+        self.animator = (
+            ProgressAnimator(self, controller.clock, animation_fps, animation_budget)
+            if animation_fps > 0
+            else None
+        )
+
+        # finished timers are hidden and reused for the next paper, not destroyed
+        if self.canvas:
+            self.timer_pool = WidgetPool(
+                "Timer",
+                lambda session: CanvasTimer(
+                    self.canvas, self.finish, session, self.renderer, self.animator
+                ),
+            )
+        else:
+            self.timer_pool = WidgetPool(
+                "Timer",
+                lambda session: Timer(
+                    self, self.finish, session, self.renderer, self.animator
+                ),
+            )
 
         self.group_timers()
         self.draw_timers()
 
+    def mark_dirty(self, subject_id: int):
+        """
+        Flags a subject for regrouping on the next group_timers() call
+        Called whenever a subject's sections are added, edited or finished
+        """
+        self.dirty_subject_ids[subject_id] = None
+
     def group_timers(self):
         """
         Groups each subject's first section (that hasn't been run) by duration
         Creates a timer for each duration
+
+        Only subjects flagged with mark_dirty() are (re)assigned to a timer,
+        every other timer is left as it is. Subjects whose timer has started
+        stay flagged, they are regrouped once it has been cleared.
         """
+        dirty = [
+            self.controller.get_subject(subject_id)
+            for subject_id in self.dirty_subject_ids
+        ]
+        self.dirty_subject_ids.clear()
+
         sections_by_duration: defaultdict[timedelta] = defaultdict(list)
 
-        # group the first not yet run section of each subject by duration
-        for subject in self.controller.subjects:
-            for section in subject.sections:
-                if not section.section_run:
-                    section.section_in_progress = True
-                    duration: timedelta = timedelta(
-                        hours=section.hours, minutes=section.minutes
-                    )
-                    sections_by_duration[duration].append(subject)
-                    break
-
-        # add a timer for each duration
+        for subject in dirty:
+            # removed subjects aren't regrouped
+            if subject is None:
+                continue
+
+            # running and finished timers keep their subjects until
+            # advance_timers(), flag them again for the regroup after that
+            timer = self.get_timer_by_id(subject.id)
+            if subject.state == Subject.RUNNING or (timer and not timer.is_idle):
+                self.mark_dirty(subject.id)
+                continue
+
+            # the first not yet run section of the subject
+            duration = subject.start_next_section()
+
+            if timer:
+                # still the right timer, just refresh the section name
+                if timer.duration == duration:
+                    timer.update_subject(subject)
+                    continue
+
+                # duration changed, take it out of its old timer
+                self.remove_subject(subject.id)
+
+            if duration is not None:
+                sections_by_duration[duration].append(subject)
+                self.controller.subjects.set_state(subject, Subject.QUEUED)
+            else:
+                self.controller.subjects.set_state(subject, Subject.IDLE)
+
+        # unstarted timers that subjects can still be added to, only collected
+        # now as the removals above may have released timers back to the pool
+        idle_timers: dict[timedelta, Timer] = {}
+        for timer in self.timers:
+            if timer.is_idle:
+                idle_timers.setdefault(timer.duration, timer)
+
+        # add the subjects to an unstarted timer of the same duration, or a new one
         for duration in sorted(sections_by_duration.keys()):
-            # check if an unstarted timer with this duration already exists
-            existing_timer: Timer | None = next(
-                (
-                    t
-                    for t in self.timers
-                    if t.duration == duration and t.is_running is False
-                ),
-                None,
-            )
+            existing_timer = idle_timers.get(duration)
             if existing_timer:
-                # if it does, add the subjects to this timer
                 for subject in sections_by_duration[duration]:
-                    # exclude subjects already in the timer
-                    if not self.get_timer_by_id(subject.id):
-                        existing_timer.add_subject(subject)
+                    existing_timer.add_subject(subject)
+                    self.timers_by_subject_id[subject.id] = existing_timer
             else:
-                # check if subjects are not already in with another timer
-                subjects_for_new_timer = [
-                    subject
-                    for subject in sections_by_duration[duration]
-                    if not self.get_timer_by_id(subject.id)
-                ]
-                if subjects_for_new_timer:
-                    timer = Timer(self, self.finish, subjects_for_new_timer, duration)
-                    self.timers.append(timer)
+                subjects_for_new_timer = sections_by_duration[duration]
+                session = self.engine.create_session(duration, subjects_for_new_timer)
+                timer = self.timer_pool.acquire(session)
+                self.timers.append(timer)
+
+                for subject in subjects_for_new_timer:
+                    self.timers_by_subject_id[subject.id] = timer
+
+    @property
+    def page_size(self) -> int:
+        return self.columns * self.rows
+
+    @property
+    def page_count(self) -> int:
+        return max(1, math.ceil(len(self.timers) / self.page_size))
 
     def draw_timers(self):
         """
-        Populates the timerpage with Timer objects
+        Populates the timerpage with the Timer objects of the current page
+        Only timers that are new or have moved are gridded, timers on other
+        pages are hidden and stop redrawing until they are shown again
         """
+        self.page = min(self.page, self.page_count - 1)
+        first = self.page * self.page_size
+
         for index, timer in enumerate(self.timers):
-            timer.frame.grid(row=0, column=index, sticky="nsew")
+            offset = index - first
+            if 0 <= offset < self.page_size:
+                timer.set_scale(self.scale)
+                timer.set_position(divmod(offset, self.columns))
+                timer.set_visible(True)
+            elif timer.position is not None:
+                timer.set_position(None)
+                timer.set_visible(False)
+
+        if self.page_count > 1:
+            self.page_label.configure(text=f"Page {self.page + 1}/{self.page_count}")
+            self.page_label.place(relx=1, rely=1, anchor="se")
+        else:
+            self.page_label.place_forget()
+
+    def update_layout(self, scale: float):
+        """
+        Works out how many timers fit across and down at the given scale,
+        redraws if that or the scale changed. Called by App.apply_layout()
+        once a resize has settled.
+
+        Args:
+            scale (float): size of the timers relative to the design size
+        """
+        padding = 40  # 20px on each side
+        columns = max(1, (self.winfo_width() - padding) // round(TIMER_WIDTH * scale))
+        rows = max(1, (self.winfo_height() - padding) // round(TIMER_HEIGHT * scale))
+        if (columns, rows, scale) == (self.columns, self.rows, self.scale):
+            return
+
+        if not self.canvas:
+            for row in range(max(rows, self.rows)):
+                self.grid_rowconfigure(row, weight=1 if row < rows else 0)
+
+        self.columns = columns
+        self.rows = rows
+        self.scale = scale
+        self.draw_timers()
+
+    def turn_page(self, step: int):
+        """
+        Shows the next (1) or previous (-1) page of timers
+        """
+        self.page = (self.page + step) % self.page_count
+        self.seconds_on_page = 0
+        self.draw_timers()
+
+    def restore_timer(self, record: dict):
+        """
+        Recreates a running or paused timer from its journal checkpoint
+        Time that passed while the app wasn't running is counted as elapsed.
+
+        Args:
+            record (dict): "timer" record, see TimerSession.checkpoint()
+        """
+        subjects = [
+            self.controller.get_subject(subject_id)
+            for subject_id in record["subjects"]
+            if self.controller.get_subject(subject_id)
+        ]
+        if not subjects:
+            return
+
+        for subject in subjects:
+            subject.start_next_section()
+            self.controller.subjects.set_state(subject, Subject.RUNNING)
+
+        session = self.engine.create_session(
+            timedelta(seconds=record["duration"]), subjects
+        )
+        timer = self.timer_pool.acquire(session)
+        self.timers.append(timer)
+
+        for subject in subjects:
+            self.timers_by_subject_id[subject.id] = timer
+
+        elapsed = record["elapsed"]
+        if record["state"] == "running":
+            downtime = self.controller.clock.now() - datetime.fromisoformat(
+                record["wall"]
+            )
+            elapsed += max(0.0, downtime.total_seconds())
+
+        session.restore(
+            elapsed,
+            paused=record["state"] == "paused",
+            start_time=datetime.fromisoformat(record["start_time"]),
+            end_time=datetime.fromisoformat(record["end_time"]),
+        )
+
+    def tick(self):
+        """
+        Called by App.scheduler once per second, advances every running timer
+        Turns the page every page_seconds if the timers don't all fit
+        """
+        self.engine.tick()
+
+        if self.page_seconds and self.page_count > 1:
+            self.seconds_on_page += 1
+            if self.seconds_on_page >= self.page_seconds:
+                self.turn_page(1)
 
     def start_timers(self):
         """
@@ -313,59 +901,49 @@ class TimerPage(ttk.Frame):
         Marks each subject as active
         Disables the button to advance to the next section
         """
-        for timer in self.timers:
-            if not timer.is_running:
-                timer.start_timer()
-                
-                # mark subjects as active
-                for subject in timer.subjects:
-                    self.controller.active_subjects.append(subject)
-                    if subject in self.controller.subjects:
-                        self.controller.subjects.remove(subject)
-    
+        starting = [timer for timer in self.timers if timer.is_idle]
+        self.engine.start()
+
+        # mark subjects as active
+        for timer in starting:
+            for subject in timer.subjects:
+                self.controller.subjects.set_state(subject, Subject.RUNNING)
+
     def resume_timers(self):
-        for timer in self.timers:
-            timer.resume_timer()
-            
+        self.engine.resume()
+
     def pause_timers(self):
-        for timer in self.timers:
-            timer.pause_timer()
+        self.engine.pause()
 
     def stop_timers(self):
-        for timer in self.timers:
-            if timer.is_running:
-                timer.stop_timer()
-                # mark subjects as inactive
-                for subject in timer.subjects:
-                    self.controller.subjects.append(subject)
-                    if subject in self.controller.active_subjects:
-                        self.controller.active_subjects.remove(subject)
+        stopping = [
+            timer for timer in self.timers if timer.is_running or timer.is_paused
+        ]
+        self.engine.stop()
+
+        # mark subjects as inactive, they stay queued in their (reset) timers
+        for timer in stopping:
+            for subject in timer.subjects:
+                self.controller.subjects.set_state(subject, Subject.QUEUED)
 
     def finish(self, subjects: list[Subject]):
         """
         Called by the Timer objects whenever a timer is finished.
-        Marks the sections as run and adds the subjects back to the subjects list
-        so that it is eligible for the next grouping run.
+        Marks the sections as run and the subjects as finished
+        so that they are eligible for the next grouping run.
         Enables the button to advance to the next section
         """
 
         for subject in subjects:
-            for section in subject.sections:
-                # mark sections as run
-                if section.section_in_progress:
-                    subject.subject_queued = False
-                    section.section_in_progress = False
-                    section.section_run = True
-                    break
-
-            # mark subject as inactive
-            self.controller.subjects.append(subject)
-            if subject in self.controller.active_subjects:
-                self.controller.active_subjects.remove(subject)
+            subject.finish_section()
+
+            # mark subject as inactive, regroup for its next section once cleared
+            self.controller.subjects.set_state(subject, Subject.FINISHED)
+            self.controller.record_subject(subject)
+            self.mark_dirty(subject.id)
 
         # activate button to start the next section
-        # self.controller.header.advance_button.configure(state="normal")
-        self.controller.header.advance_button.pack()
+        self.controller.header.enable_next_button()
 
     def advance_timers(self):
         """
@@ -374,25 +952,32 @@ class TimerPage(ttk.Frame):
         """
 
         # destroy finished timers
-        for timer in self.timers:
+        for timer in list(self.timers):
             if timer.finished:
-                timer.frame.destroy()
-                self.timers.remove(timer)
+                self.remove_timer(timer)
 
         # regroup and start new timers
         self.group_timers()
         self.draw_timers()
 
+    def remove_timer(self, timer: Timer):
+        """
+        Destroys a timer's UI and drops its session from the engine
+        """
+        self.timer_pool.release(timer)
+        self.engine.remove_session(timer.session)
+        self.timers.remove(timer)
+
+        for subject in timer.subjects:
+            if self.timers_by_subject_id.get(subject.id) is timer:
+                del self.timers_by_subject_id[subject.id]
+                self.controller.subjects.set_state(subject, Subject.IDLE)
+
     def get_timer_by_id(self, subject_id: int) -> Timer | None:
         """
         Returns the timer object that contains the subject with the given ID
         """
-
-        for timer in self.timers:
-            for subject in timer.subjects:
-                if subject.id == subject_id:
-                    return timer
-        return None
+        return self.timers_by_subject_id.get(subject_id)
 
     def update_subject_name(self, subject_id: int, name):
         """
@@ -400,10 +985,7 @@ class TimerPage(ttk.Frame):
         """
         timer = self.get_timer_by_id(subject_id)
         if timer:
-            for subject_label in timer.subject_list.labels:
-                if subject_label.id == subject_id:
-                    subject_label.update_details(name)
-                    break
+            timer.subject_list.labels[subject_id].update_details(name)
         else:
             return Exception("Subject not found")
 
@@ -416,13 +998,13 @@ class TimerPage(ttk.Frame):
         timer = self.get_timer_by_id(subject_id)
         if timer:
             if len(timer.subject_list.labels) == 1:
-                timer.frame.destroy()
-                self.timers.remove(timer)
+                self.remove_timer(timer)
             else:
-                for subject_label in timer.subject_list.labels:
-                    if subject_label.id == subject_id:
-                        subject_label.frame.destroy()
-                        break
+                timer.remove_subject(subject_id)
+                del self.timers_by_subject_id[subject_id]
+                subject = self.controller.get_subject(subject_id)
+                if subject:
+                    self.controller.subjects.set_state(subject, Subject.IDLE)
         else:
             return Exception("Subject not found")
 
@@ -432,10 +1014,7 @@ class TimerPage(ttk.Frame):
         """
         timer = self.get_timer_by_id(subject_id)
         if timer:
-            for subject_label in timer.subject_list.labels:
-                if subject_label.id == subject_id:
-                    subject_label.update_details(level=level)
-                    break
+            timer.subject_list.labels[subject_id].update_details(level=level)
         else:
             return Exception("Subject not found")
 
@@ -450,6 +1029,12 @@ class EditorPage(ttk.Frame):
         Initializes the UI for the editor page
         Allows the user to add and configure subjects and sections
         """
+        from editor import (  # pylint: disable=import-outside-toplevel
+            EditorNewSubject,
+            EditorSection,
+            EditorSubjectList,
+        )
+
         ttk.Frame.__init__(self, parent)
 
         self.controller: App = controller
@@ -460,8 +1045,17 @@ class EditorPage(ttk.Frame):
         self.editor_canvas = tk.Canvas(self)
         self.editor_canvas.pack(fill="both", expand=True)
 
+        # section editors are reused when switching between subjects
+        self.section_pool = WidgetPool(
+            "EditorSection",
+            lambda *details: EditorSection(self.editor_canvas, *details),
+            limit=4,  # most sections a subject can have
+        )
+
         # draw subject addition/selection elements
-        self.new_subject = EditorNewSubject(self.editor_canvas, self.create_subject)
+        self.new_subject = EditorNewSubject(
+            self.editor_canvas, self.create_subject, self.import_subjects
+        )
 
         # TODO: why am i passing all of this in?
         self.listbox = EditorSubjectList(
@@ -471,7 +1065,6 @@ class EditorPage(ttk.Frame):
             self.remove_subject,
             self.toggle_subject_level,
             self.controller.subjects,
-            self.controller.active_subjects,
         )
 
         # bind to window closing
@@ -487,22 +1080,68 @@ class EditorPage(ttk.Frame):
         # check if subject already exists
         if any(
             (subject.name == subject_name and subject.level == level)
-            for subject in self.controller.subjects + self.controller.active_subjects
+            for subject in self.controller.subjects
         ):
             self.new_subject.status_msg("Subject already exists!")
             return
 
         subject = Subject(subject_name, level)
-        self.controller.subjects.append(subject)
+        self.controller.add_subject(subject)
+        self.controller.timer_page.mark_dirty(subject.id)
+
+        # add the subject's row to the list
+        self.listbox.insert_subject(subject)
+
+    def import_subjects(self):
+        """
+        Called by editor.EditorNewSubject to import a schedule file
+        Every row is validated first, nothing is imported if any row is invalid.
+        The new rows are added to the list of subjects together at the end.
+        """
+        from tkinter import filedialog, messagebox  # pylint: disable=import-outside-toplevel
+
+        from importer import read_schedule  # pylint: disable=import-outside-toplevel
+
+        path = filedialog.askopenfilename(
+            parent=self.master,
+            title="Import schedule",
+            filetypes=[("Schedule", "*.csv *.json *.jsonl"), ("All files", "*")],
+        )
+        if not path:
+            return
 
-        # redraw list of subjects
-        self.listbox.update_list()
+        existing = {
+            (subject.name, subject.level) for subject in self.controller.subjects
+        }
+        subject_details, errors = read_schedule(path, existing)
+
+        if errors:
+            shown = "\n".join(errors[:15])
+            if len(errors) > 15:
+                shown += f"\n...and {len(errors) - 15} more"
+            messagebox.showerror("Import failed", shown, parent=self.master)
+            return
+
+        imported = []
+        for details in subject_details:
+            subject = Subject(details["name"], details["level"])
+            for name, hours, minutes in details["sections"]:
+                subject.sections.append(Section(name, hours, minutes))
+
+            self.controller.add_subject(subject)
+            self.controller.timer_page.mark_dirty(subject.id)
+            imported.append(subject)
+        self.listbox.insert_subjects(imported)
+        self.new_subject.status_msg(
+            f"Imported {len(subject_details)} subjects", fill="#000000"
+        )
 
     def configure_subject(self, subject_id: int):
         """
         Called by editor.EditorSubjectList each time a subject is selected
         Draws the UI (EditorSectionList component) to configure sections
         """
+        from editor import EditorSectionList  # pylint: disable=import-outside-toplevel
 
         # destroy any existing UI (if there was a previously selected subject)
         # old EditorSectionList would become ready for garbage collection (safe)
@@ -518,24 +1157,20 @@ class EditorPage(ttk.Frame):
             self.editor_canvas,
             subject.sections,
             self.register_sections,
+            self.section_pool,
         )
 
     def remove_subject(self, subject_id: int):
         """
         Called by editor.EditorSubjectList to remove the given subject
         """
-        subject: Subject = self.controller.get_subject(subject_id)
-
-        # remove subject object
-        if subject in self.controller.subjects:
-            self.controller.subjects.remove(subject)
-        elif subject in self.controller.active_subjects:
-            self.controller.active_subjects.remove(subject)
-
         # remove from listbox and destroy configuration ui
-        self.listbox.update_list()
+        self.listbox.delete_subject(subject_id)
         self.section_config.destroy()
 
+        # remove subject object
+        self.controller.remove_subject(subject_id)
+
         # remove from TimerPage
         self.controller.timer_page.remove_subject(subject_id)
 
@@ -544,6 +1179,8 @@ class EditorPage(ttk.Frame):
         Called by editor.EditorSubjectList to rename the given subject
         Creates a dialog to get the new name
         """
+        from tkinter import simpledialog  # pylint: disable=import-outside-toplevel
+
         new_name = simpledialog.askstring("Rename subject", "New name:")
 
         # only update the name if Ok was pressed on the simpledialog, not cancel
@@ -551,9 +1188,10 @@ class EditorPage(ttk.Frame):
             # update name in subject object
             subject: Subject = self.controller.get_subject(subject_id)
             subject.name = new_name
+            self.controller.record_subject(subject)
 
             # update name in listbox
-            self.listbox.update_list()
+            self.listbox.refresh_subject(subject)
 
             # update name in TimerPage
             self.controller.timer_page.update_subject_name(subject_id, new_name)
@@ -568,9 +1206,10 @@ class EditorPage(ttk.Frame):
         # update level in subject object
         subject: Subject = self.controller.get_subject(subject_id)
         subject.level = 1 - subject.level  # toggle
+        self.controller.record_subject(subject)
 
         # update level in listbox
-        self.listbox.update_list()
+        self.listbox.refresh_subject(subject)
 
         # update level in TimerPage
         self.controller.timer_page.update_subject_level(subject_id, subject.level)
@@ -594,20 +1233,79 @@ class EditorPage(ttk.Frame):
             section = Section(name, hours, minutes)
             subject.sections.append(section)
 
-        # update the listbox and the dictionary
-        self.listbox.update_list()
+        self.controller.record_subject(subject)
+
+        # regroup this subject when the editor is closed
+        # (the listbox only shows names and levels, so it doesn't change)
+        self.controller.timer_page.mark_dirty(subject.id)
 
     def close(self):
         """
-        When the editor window is closed, redraw and regroup all timers
+        When the editor window is closed, regroup the edited subjects and redraw
         """
         self.controller.timer_page.group_timers()
         self.controller.timer_page.draw_timers()
 
         # destroy the editor window
         self.master.destroy()
+        self.controller.check_leaks("editor")
 
 
-# create an instance of the app
-app = App()
-app.root.mainloop()
+def main():
+    """
+    Starts the exam clock
+    set EXAM_CLOCK_SPEED (e.g. 100) to run on a simulated clock for testing
+    set EXAM_CLOCK_JOURNAL to move the crash recovery journal, or to "" to
+    disable it
+    set EXAM_CLOCK_PROFILE to a file path to record tick timings, dumped there
+    on Ctrl+D and on exit (F12 shows/hides the overlay)
+    set EXAM_CLOCK_STARTUP_BUDGET (ms) to warn when the clock takes longer than
+    that to first appear, and EXAM_CLOCK_STARTUP_CHECK to quit right after with
+    exit status 1 if it was over budget (e.g. in CI, under xvfb-run)
+    """
+    started = STARTED
+    imported = time.perf_counter()
+
+    logging.basicConfig(level=logging.INFO)
+    speed = os.environ.get("EXAM_CLOCK_SPEED")
+    journal_path = os.environ.get(
+        "EXAM_CLOCK_JOURNAL",
+        os.path.join(os.path.expanduser("~"), ".nist-exam-clock", "journal.jsonl"),
+    )
+    profile_path = os.environ.get("EXAM_CLOCK_PROFILE")
+    app = App(
+        SimulatedClock(speed=float(speed)) if speed else None,
+        Journal(journal_path) if journal_path else None,
+        TickProfiler() if profile_path else None,
+        profile_path,
+    )
+    constructed = time.perf_counter()
+
+    # startup report, the clock header is painted by the first update
+    app.root.update()
+    painted = time.perf_counter()
+    logging.info(
+        "Clock painted %.0f ms after start (imports %.0f ms, window %.0f ms, "
+        "first paint %.0f ms)",
+        (painted - started) * 1000,
+        (imported - started) * 1000,
+        (constructed - imported) * 1000,
+        (painted - constructed) * 1000,
+    )
+
+    budget = os.environ.get("EXAM_CLOCK_STARTUP_BUDGET")
+    over_budget = budget and (painted - started) * 1000 > float(budget)
+    if over_budget:
+        logging.warning("Startup is over the %s ms budget", budget)
+
+    if os.environ.get("EXAM_CLOCK_STARTUP_CHECK"):
+        app.close()
+        sys.exit(1 if over_budget else 0)
+
+    app.root.mainloop()
+
+
+# only create the app when run directly (python main.py / python -m main),
+# so the model and logic can be imported by benchmarks and tests
+if __name__ == "__main__":
+    main()
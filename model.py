@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta
+
+
+class Subject:
+    """
+    Represents an IB subject which may contain multiple papers.
+    """
+
+    id_counter: int = 0
+
+    # states of a subject, kept in Subject.state
+    IDLE = "idle"  # not in any timer
+    QUEUED = "queued"  # in a timer that hasn't been started
+    RUNNING = "running"  # in a running or paused timer
+    FINISHED = "finished"  # timer finished, waiting for "Next"
+    STATES = (IDLE, QUEUED, RUNNING, FINISHED)
+
+    def __init__(self, name: str, level: int) -> None:
+        self.name: str = name
+        self.level: int = level  # 0 for SL, 1 for HL
+        self.sections: list[Section] = []
+
+        self.id: int = Subject.id_counter
+        Subject.id_counter += 1
+
+        self.timestamp: datetime = datetime.now().astimezone()
+        self.state: str = Subject.IDLE
+
+    def next_section(self) -> "Section | None":
+        """
+        Returns the first section that hasn't been run, None if all have been
+        """
+        for section in self.sections:
+            if not section.section_run:
+                return section
+        return None
+
+    def start_next_section(self) -> timedelta | None:
+        """
+        Marks the first section that hasn't been run as in progress
+
+        Returns:
+            timedelta | None: duration of that section, None if all have been run
+        """
+        section = self.next_section()
+        if section is None:
+            return None
+
+        section.section_in_progress = True
+        return section.duration
+
+    def finish_section(self):
+        """
+        Marks the section in progress as run
+        """
+        for section in self.sections:
+            if section.section_in_progress:
+                section.section_in_progress = False
+                section.section_run = True
+                break
+
+
+class Section:
+    """
+    Represents a single section (paper) of a subject, e.g. Paper 1 of a subject.
+    """
+
+    id_counter: int = 0
+
+    def __init__(self, name: str, hours: int, minutes: int) -> None:
+        """
+        Initializes a new section.
+        """
+        self.name: str = name
+        self.hours: int = hours
+        self.minutes: int = minutes
+
+        self.section_in_progress: bool = False
+        self.section_run: bool = False
+
+        self.id: int = Section.id_counter
+        Section.id_counter += 1
+
+    @property
+    def duration(self) -> timedelta:
+        return timedelta(hours=self.hours, minutes=self.minutes)
+
+
+class SubjectRegistry:
+    """
+    Ordered collection of every subject, keyed by ID and grouped by state.
+    Adding, removing, looking up and changing the state of a subject are O(1).
+    """
+
+    def __init__(self) -> None:
+        self.subjects: dict[int, Subject] = {}
+        self.by_state: dict[str, dict[int, Subject]] = {
+            state: {} for state in Subject.STATES
+        }
+
+    def __iter__(self):
+        return iter(list(self.subjects.values()))
+
+    def __len__(self) -> int:
+        return len(self.subjects)
+
+    def __contains__(self, subject: Subject) -> bool:
+        return self.subjects.get(subject.id) is subject
+
+    def add(self, subject: Subject):
+        self.subjects[subject.id] = subject
+        self.by_state[subject.state][subject.id] = subject
+
+    def remove(self, subject_id: int) -> Subject | None:
+        subject = self.subjects.pop(subject_id, None)
+        if subject:
+            del self.by_state[subject.state][subject_id]
+        return subject
+
+    def get(self, subject_id: int) -> Subject | None:
+        return self.subjects.get(subject_id)
+
+    def set_state(self, subject: Subject, state: str):
+        """
+        Moves a subject to a new state, subjects no longer stored are ignored
+        """
+        if subject not in self:
+            return
+
+        del self.by_state[subject.state][subject.id]
+        subject.state = state
+        self.by_state[state][subject.id] = subject
+
+    def with_state(self, state: str) -> list[Subject]:
+        return list(self.by_state[state].values())
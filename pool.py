@@ -0,0 +1,72 @@
+import weakref
+
+# every pool, so their counters can be shown together in the debug overlay
+POOLS: weakref.WeakSet = weakref.WeakSet()
+
+
+class WidgetPool:
+    def __init__(self, name: str, create, limit: int = 16) -> None:
+        """
+        Keeps released widget trees hidden for reuse instead of destroying them.
+        Pooled objects implement bind(...) to show new data, release() to hide
+        themselves and destroy() for when the pool is full.
+
+        Args:
+            name (str): name the counters are reported under, pools with the
+            same name are added together
+            create (function): called with the arguments of acquire() when there
+            is nothing to reuse, returns a new object (which binds them itself)
+            limit (int, optional): most objects kept for reuse, any more released
+            are destroyed. Defaults to 16.
+        """
+        self.name = name
+        self.create = create
+        self.limit = limit
+
+        self.free: list = []
+        self.hits = 0
+        self.misses = 0
+
+        POOLS.add(self)
+
+    def acquire(self, *args, **kwargs):
+        """
+        Returns a released object rebound to the given data, or a new one
+        """
+        if self.free:
+            self.hits += 1
+            item = self.free.pop()
+            item.bind(*args, **kwargs)
+            return item
+
+        self.misses += 1
+        return self.create(*args, **kwargs)
+
+    def release(self, item):
+        """
+        Hides an object and keeps it for the next acquire()
+        """
+        item.release()
+        if len(self.free) < self.limit:
+            self.free.append(item)
+        else:
+            item.destroy()
+
+
+def pool_stats() -> dict:
+    """
+    Returns:
+        dict: free objects, hits, misses and hit rate of each kind of pool
+    """
+    stats: dict[str, dict] = {}
+    for pool in list(POOLS):
+        counters = stats.setdefault(pool.name, {"free": 0, "hits": 0, "misses": 0})
+        counters["free"] += len(pool.free)
+        counters["hits"] += pool.hits
+        counters["misses"] += pool.misses
+
+    for counters in stats.values():
+        acquired = counters["hits"] + counters["misses"]
+        counters["hit_rate"] = counters["hits"] / acquired if acquired else 0.0
+
+    return stats
@@ -0,0 +1,149 @@
+import collections
+import contextlib
+import itertools
+import json
+import math
+import time
+
+
+class TickProfiler:
+    def __init__(self, size: int = 600) -> None:
+        """
+        Opt-in instrumentation of the tick loop. For every tick it records when
+        the callback was due, when Tk actually ran it, and how long each part of
+        the update took (header clock, each timer, the batched redraw).
+        Only the last size ticks are kept.
+
+        Measurements can be nested (e.g. each timer inside TimerPage.tick), the
+        update time of a tick only adds up the outermost ones.
+
+        Args:
+            size (int, optional): number of ticks kept. Defaults to 600 (10 min).
+        """
+        self.ticks: collections.deque = collections.deque(maxlen=size)
+        self.current: dict | None = None
+        self.due: float | None = None
+        self.depth = 0  # measurements currently open inside each other
+
+        # recorded, but not counted as update time, e.g. the debug overlay
+        self.overhead: set[str] = set()
+
+    def expect(self, delay: float):
+        """
+        Called when the next tick is scheduled
+
+        Args:
+            delay (float): real seconds until the tick is due
+        """
+        self.due = time.perf_counter() + delay
+
+    def begin_tick(self):
+        """
+        Called as a tick starts, later measurements are added to it
+        """
+        actual = time.perf_counter()
+        due = actual if self.due is None else self.due
+
+        self.current = {"due": due, "actual": actual, "durations": {}, "update": 0.0}
+        self.ticks.append(self.current)
+
+    @contextlib.contextmanager
+    def measure(self, name: str):
+        """
+        Adds the time spent in the with block to the current tick
+
+        Args:
+            name (str): what is being measured, e.g. "timer 3"
+        """
+        start = time.perf_counter()
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            if self.current is not None:
+                duration = time.perf_counter() - start
+                durations = self.current["durations"]
+                durations[name] = durations.get(name, 0.0) + duration
+                if self.depth == 0 and name not in self.overhead:
+                    self.current["update"] += duration
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: number of ticks, p50/p99 lag of the tick callback behind its
+            due time, largest change in lag between consecutive ticks (jitter)
+            and p99 of the update time per tick (outermost measurements only,
+            without overhead), all in ms
+        """
+        ticks = list(self.ticks)
+        lags = sorted(tick["actual"] - tick["due"] for tick in ticks)
+        updates = sorted(tick["update"] for tick in ticks)
+        jitter = max(
+            (
+                abs((b["actual"] - b["due"]) - (a["actual"] - a["due"]))
+                for a, b in itertools.pairwise(ticks)
+            ),
+            default=0.0,
+        )
+
+        return {
+            "ticks": len(ticks),
+            "lag_p50_ms": percentile(lags, 50) * 1000,
+            "lag_p99_ms": percentile(lags, 99) * 1000,
+            "jitter_max_ms": jitter * 1000,
+            "update_p99_ms": percentile(updates, 99) * 1000,
+        }
+
+    def dump(self, path: str, **counters):
+        """
+        Writes the summary and every recorded tick to a JSON file
+
+        Args:
+            path (str): file to write to, replaced if it exists
+            **counters: other JSON serializable debug counters to include,
+            e.g. pools=pool.pool_stats()
+        """
+        ticks = list(self.ticks)
+        origin = ticks[0]["due"] if ticks else 0.0
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "stats": self.stats(),
+                    **counters,
+                    "ticks": [
+                        {
+                            "due_ms": (tick["due"] - origin) * 1000,
+                            "lag_ms": (tick["actual"] - tick["due"]) * 1000,
+                            "update_ms": tick["update"] * 1000,
+                            "durations_ms": {
+                                name: duration * 1000
+                                for name, duration in tick["durations"].items()
+                            },
+                        }
+                        for tick in ticks
+                    ],
+                },
+                file,
+                indent=2,
+            )
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of already sorted values, 0.0 if there are none
+    """
+    if not values:
+        return 0.0
+    rank = math.ceil(percent / 100 * len(values))
+    return values[max(0, rank - 1)]
+
+
+def profiled(profiler: TickProfiler | None, name: str):
+    """
+    profiler.measure(name), or a no-op if profiling is off
+    """
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.measure(name)
@@ -0,0 +1,167 @@
+import collections
+import logging
+import statistics
+import time
+
+from profiler import profiled
+from scheduler import AfterHandle
+
+logger = logging.getLogger(__name__)
+
+
+class RenderQueue:
+    def __init__(self, widget) -> None:
+        """
+        Collects widget writes made during a tick and applies them together in a
+        single after_idle() callback, so all timers are redrawn in one batch.
+        Writes to the same key before a flush are coalesced, the last one wins.
+
+        Args:
+            widget (tkinter widget): any widget, used to access after_idle()
+        """
+        self.widget = widget
+        self.pending: dict = {}
+        self.handle = AfterHandle(widget)
+        self.profiler = None  # TickProfiler, set to time each flush
+
+    def queue(self, key, apply, value):
+        """
+        Queues a widget write for the next flush
+
+        Args:
+            key (tuple): (owner, name) identifying what is being written
+            apply (function): called as apply(value) to write to the widget
+            value: new value for the widget
+        """
+        self.pending[key] = (apply, value)
+
+        if not self.handle.pending:
+            self.handle.schedule_idle(self.flush)
+
+    def discard(self, owner):
+        """
+        Drops pending writes of a component, e.g. before its widgets are destroyed
+        """
+        for key in [key for key in self.pending if key[0] is owner]:
+            del self.pending[key]
+
+    def flush(self):
+        self.handle.cancel()  # when called directly
+        pending, self.pending = self.pending, {}
+
+        with profiled(self.profiler, "render"):
+            for apply, value in pending.values():
+                apply(value)
+
+
+class ProgressAnimator:
+    def __init__(self, widget, clock, fps: int = 30, budget: float = 8.0) -> None:
+        """
+        Moves the progressbars of running timers smoothly between ticks, from one
+        after() loop shared by every bar. Bars only move by whole pixels, so a
+        frame in which no bar would move a pixel writes nothing.
+        The elapsed/remaining text is still only changed by the per-second tick.
+
+        If frames take longer than the budget on average over a second, e.g. on a
+        slow machine or with many timers on the page, animation is turned off and
+        the progressbars go back to moving once per tick.
+
+        Args:
+            widget (tkinter widget): any widget, used to access after()
+            clock (SystemClock | SimulatedClock): time source of the timers
+            fps (int, optional): frames per second. Defaults to 30.
+            budget (float, optional): most ms a frame may take on average,
+            including redrawing the bars that moved. Defaults to 8.
+        """
+        self.widget = widget
+        self.clock = clock
+        self.delay = max(1, round(1000 / fps))
+        self.budget = budget
+        self.fps = fps
+
+        self.bars: dict = {}  # ProgressBar -> TimerSession it shows
+        self.pixels: dict = {}  # ProgressBar -> length of the bar as last drawn
+        self.costs: collections.deque = collections.deque(maxlen=fps)  # ms
+        self.handle = AfterHandle(widget)
+        self.fallen_back = False
+
+    def add(self, bar, session):
+        """
+        Starts animating a bar, its progress is no longer set by the tick
+
+        Args:
+            bar (timer.ProgressBar): progressbar to animate
+            session (engine.TimerSession): session the progress is read from
+        """
+        if self.fallen_back or bar in self.bars:
+            return
+
+        self.bars[bar] = session
+        bar.animated = True
+
+        if not self.handle.pending:
+            self.handle.schedule(self.delay, self.frame)
+
+    def remove(self, bar):
+        """
+        Stops animating a bar, the next tick sets its progress again
+        """
+        if self.bars.pop(bar, None) is None:
+            return
+
+        self.pixels.pop(bar, None)
+        bar.animated = False
+        bar.rendered.pop("progress", None)  # written on the next update
+
+        if not self.bars:
+            self.handle.cancel()
+
+    def frame(self):
+        start = time.perf_counter()
+        now = self.clock.monotonic()
+
+        moved = False
+        for bar, session in self.bars.items():
+            length = bar.length
+            progress = session.elapsed_at(now) / session.duration.total_seconds()
+            pixels = min(length, round(length * progress))
+            if self.pixels.get(bar) != pixels:
+                self.pixels[bar] = pixels
+                bar.set_progress(100 * pixels / length)
+                moved = True
+
+        if moved:
+            self.widget.update_idletasks()  # count the redraw in the frame cost
+        self.costs.append((time.perf_counter() - start) * 1000)
+
+        if len(self.costs) == self.fps and statistics.fmean(self.costs) > self.budget:
+            logger.warning(
+                "Frames took %.1fms on average, over the %.1fms budget, "
+                "progressbars now move once per second",
+                statistics.fmean(self.costs),
+                self.budget,
+            )
+            self.fall_back()
+        elif self.bars:
+            self.handle.schedule(self.delay, self.frame)
+
+    def fall_back(self):
+        """
+        Turns animation off for good, every bar is set by the tick again
+        """
+        self.fallen_back = True
+        for bar in list(self.bars):
+            self.remove(bar)
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: target fps, number of animated bars, mean frame cost over the
+            last second in ms and whether animation was turned off
+        """
+        return {
+            "fps": self.fps,
+            "bars": len(self.bars),
+            "frame_ms": statistics.fmean(self.costs) if self.costs else 0.0,
+            "fallen_back": self.fallen_back,
+        }
@@ -0,0 +1,189 @@
+import datetime
+import logging
+import math
+
+from clock import SystemClock
+from profiler import profiled
+
+logger = logging.getLogger(__name__)
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+
+class AfterHandle:
+    """
+    Owns one after() callback slot. Scheduling again cancels the callback that
+    is still pending, so each handle has exactly one outstanding callback or none
+    and repeated pause/resume can never pile up loops.
+    """
+
+    outstanding = 0  # pending callbacks of every handle, should stay bounded
+
+    def __init__(self, widget) -> None:
+        """
+        Args:
+            widget (tkinter widget): any widget, used to access after()
+        """
+        self.widget = widget
+        self.after_id = None
+
+    @property
+    def pending(self) -> bool:
+        return self.after_id is not None
+
+    def schedule(self, delay: int, callback, *args):
+        """
+        Calls callback(*args) after delay ms, replacing any pending callback
+        """
+        self.cancel()
+        self.after_id = self.widget.after(delay, self.wrap(callback, args))
+        AfterHandle.outstanding += 1
+
+    def schedule_idle(self, callback, *args):
+        """
+        Calls callback(*args) once Tk is idle, replacing any pending callback
+        """
+        self.cancel()
+        self.after_id = self.widget.after_idle(self.wrap(callback, args))
+        AfterHandle.outstanding += 1
+
+    def cancel(self):
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+            AfterHandle.outstanding -= 1
+
+    def wrap(self, callback, args):
+        """
+        Clears the handle before the callback runs, so it can schedule itself
+        again. Named after the callback, which is how Tk lists it (see
+        diagnostics.LeakDetector).
+        """
+
+        def run():
+            self.after_id = None
+            AfterHandle.outstanding -= 1
+            callback(*args)
+
+        run.__name__ = getattr(callback, "__name__", "run")
+        return run
+
+
+class TickScheduler:
+    def __init__(self, widget, clock=None) -> None:
+        """
+        Drives every once-per-second update in the app from a single Tk callback.
+        Each tick is aligned to the next wall clock second boundary, so the header
+        clock and all timer readouts change on the same frame.
+
+        Args:
+            widget (tkinter widget): any widget, used to access after()
+            clock (SystemClock | SimulatedClock, optional): time source whose
+            seconds are followed. Defaults to the system clock.
+        """
+        self.widget = widget
+        self.clock = SystemClock() if clock is None else clock
+
+        # dict used as an ordered set, so unsubscribing is O(1)
+        self.subscribers: dict = {}
+        self.handle = AfterHandle(widget)
+        self.profiler = None  # TickProfiler, set to record tick lag and timings
+
+    def subscribe(self, callback):
+        """
+        Registers a callback to be called on every tick
+
+        Args:
+            callback (function): called with no arguments once per second
+        """
+        self.subscribers[callback] = None
+
+    def unsubscribe(self, callback):
+        self.subscribers.pop(callback, None)
+
+    def start(self):
+        if not self.handle.pending:
+            self.schedule()
+
+    def stop(self):
+        self.handle.cancel()
+
+    def schedule(self):
+        """
+        Schedules the next tick for the start of the next wall clock second.
+        A ms of margin makes sure the tick never lands just before the boundary.
+        Replaces the pending tick if tick() was called early, e.g. by Ctrl+J.
+        """
+        delay = math.ceil(self.clock.until_next_second() * 1000) + 1
+        if self.profiler:
+            self.profiler.expect(delay / 1000)
+        self.handle.schedule(delay, self.tick)
+
+    def tick(self):
+        """
+        Fans the tick out to all subscribers in one pass
+        The next tick is scheduled first so a failing subscriber can't stop the clock
+        """
+        if self.profiler:
+            self.profiler.begin_tick()
+        self.schedule()
+
+        for callback in list(self.subscribers):
+            with profiled(self.profiler, callback.__qualname__):
+                callback()
+
+
+class ClockDriftDetector:
+    def __init__(self, clock=None, threshold: float = 2.0) -> None:
+        """
+        Watches for the wall clock being stepped relative to the monotonic clock
+        (NTP corrections, DST changes, someone changing the system time)
+        Timers measure time on the monotonic clock, so a step only moves the
+        displayed wall clock start/end times, never the remaining time.
+
+        Args:
+            clock (SystemClock | SimulatedClock, optional): clock to watch.
+            Defaults to the system clock.
+            threshold (float, optional): seconds of divergence before a step is
+            reported. Defaults to 2.0.
+        """
+        self.clock = SystemClock() if clock is None else clock
+        self.threshold = threshold
+        self.reset()
+
+    def reset(self):
+        self.offset = self.local_time() - self.clock.monotonic()
+
+    def local_time(self) -> float:
+        """
+        Local wall clock time in seconds, includes DST changes unlike time.time()
+        """
+        return (self.clock.now() - EPOCH).total_seconds()
+
+    def check(self, now: float | None = None) -> float:
+        """
+        Compares the wall clock against the monotonic clock
+
+        Args:
+            now (float, optional): clock.monotonic() reading for this tick
+
+        Returns:
+            float: seconds the wall clock was stepped by since the last check,
+            0.0 if it hasn't diverged past the threshold
+        """
+        if now is None:
+            now = self.clock.monotonic()
+
+        offset = self.local_time() - now
+        shift = offset - self.offset
+
+        if abs(shift) < self.threshold:
+            return 0.0
+
+        self.offset = offset
+        logger.warning(
+            "Wall clock stepped by %+.1fs relative to the monotonic clock, "
+            "displayed start/end times have been shifted",
+            shift,
+        )
+        return shift
@@ -0,0 +1,114 @@
+# soak test: replays a simulated exam day, cycle after cycle, and fails if
+# widgets, after() callbacks, variable traces or components keep piling up
+#
+#   xvfb-run python soak.py [--cycles 20] [--subjects 30]
+#
+# each cycle opens the editor, removes the last cycle's subjects, adds new ones
+# (switching between them like a user would), closes the editor, runs the exam
+# to the end on a simulated clock (pausing, resuming and skipping ahead along the
+# way) and presses "Next"
+
+import argparse
+import logging
+import random
+import sys
+import tkinter as tk
+
+from clock import SimulatedClock
+from diagnostics import LeakDetector
+from main import App, EditorPage
+from model import Subject
+from scheduler import AfterHandle
+
+# section durations to pick from, in minutes
+DURATIONS = list(range(30, 181, 15))
+
+
+def run_cycle(app, rng, subjects):
+    """
+    One editor session and one exam, as done between papers on an exam day
+    """
+    popup = tk.Toplevel(app.root)
+    editor = EditorPage(popup, app)
+
+    for subject in list(app.subjects):
+        editor.configure_subject(subject.id)
+        editor.remove_subject(subject.id)
+
+    for index in range(subjects):
+        editor.create_subject(f"Subject {index}", index % 2)
+        editor.configure_subject(Subject.id_counter - 1)
+
+        minutes = rng.choice(DURATIONS)
+        editor.register_sections(["Paper 1"], [minutes // 60], [minutes % 60])
+
+    editor.close()
+    app.root.update()
+
+    app.header.on_start_button_click()
+
+    # pausing and resuming must never leave extra callbacks behind
+    outstanding = AfterHandle.outstanding
+    for _ in range(50):
+        app.header.on_pause_button_click()
+        app.header.on_resume_button_click()
+        app.skip_to_next_event()
+    if AfterHandle.outstanding > outstanding:
+        raise AssertionError(
+            f"after callbacks grew from {outstanding} to {AfterHandle.outstanding}"
+        )
+
+    app.timer_page.engine.run_until_finished()
+    app.root.update()
+
+    app.header.on_next_button_click()
+    app.root.update()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replays exam days and fails if anything keeps piling up"
+    )
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--subjects", type=int, default=30)
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=3,
+        help="cycles to run before the baseline, while pools and caches fill up",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    app = App(SimulatedClock(speed=0))
+    detector = LeakDetector(app.root)
+    rng = random.Random(0)
+
+    for _ in range(args.warmup):
+        run_cycle(app, rng, args.subjects)
+    baseline = detector.snapshot()
+
+    for _ in range(args.cycles):
+        run_cycle(app, rng, args.subjects)
+        detector.check("cycle")
+
+    final = detector.snapshot()
+    grown = {
+        key: (baseline[key], final[key])
+        for key in final
+        if final[key] > baseline[key]
+    }
+    leaks = detector.leaks("cycle")
+    app.root.destroy()
+
+    for key, (before, after) in sorted(grown.items()):
+        print(f"{key}: {before} -> {after}", file=sys.stderr)
+
+    if leaks or grown:
+        print(f"FAIL, still growing: {', '.join(leaks) or 'none'}", file=sys.stderr)
+        sys.exit(1)
+    print(f"OK, {args.cycles} cycles without growth", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,32 @@ HEADING = [
     "system 18",
 ]
 
+# space taken by one timer on the TimerPage, used to work out how many fit
+TIMER_WIDTH = 460  # progressbar canvas plus padding
+TIMER_HEIGHT = 400  # room for a few subjects and the info below them
+
+# window size the layout is designed for, everything is scaled relative to it
+BASE_WIDTH = 1920
+BASE_HEIGHT = 1080
+
+
+def scaled_font(font: str, scale: float, extra_style: str = "") -> tuple:
+    """
+    Scales a font from HEADING, e.g. "system 32 bold" at 0.5 -> system 16 bold
+
+    Args:
+        font (str): "family size [style...]"
+        scale (float): factor to multiply the size by
+        extra_style (str, optional): style to add, e.g. "overstrike"
+
+    Returns:
+        tuple: font for tkinter
+    """
+    family, size, *style = font.split()
+    style = " ".join(style + extra_style.split())
+    size = max(1, round(int(size) * scale))
+    return (family, size, style) if style else (family, size)
+
 
 # definition for rounded rectangle for styling
 def round_rectangle(canvas, x1, y1, x2, y2, radius=25, **kwargs):
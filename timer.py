@@ -4,103 +4,195 @@ from tkinter.constants import HORIZONTAL
 
 import ttkbootstrap as ttk
 
-from style import HEADING
+from glyphs import DigitReadout
+from pool import WidgetPool
+from scheduler import AfterHandle
+from style import HEADING, scaled_font
+
+# remaining time colour after the 30 and 5min marks
+ALERT_COLOURS = {"thirty_min": "#F0A202", "five_min": "#D62828"}
 
 
 class Timer:
     # TODO: use unique id to allow changing details after starting timer
-    def __init__(self, parent, callback, subjects_with_duration, duration) -> None:
+    def __init__(
+        self, parent, callback, session, renderer=None, animator=None
+    ) -> None:
         """
         Initializes the UI component for one timer
         (one timer = one duration, group of subjects)
+        The timing itself is done by the TimerSession, this only draws it.
+        Timers are pooled by TimerPage, see bind() and release().
 
         Args:
             parent (TimerPage): parent tkinter frame
             callback (function): TimerPage.finish()
-            subjects_with_duration (list): list of Subject objs with the same duration
-            (datetime.timedelta): duration of the timer
+            session (engine.TimerSession): session holding the timer's state
+            renderer (render.RenderQueue, optional): batches per-tick redraws
+            animator (render.ProgressAnimator, optional): moves the progressbar
+            smoothly between ticks while the timer is running and on the page
+        """
+        self.callback = callback
+        self.info = None
+        self.position = None  # (row, column) on the page, see set_position()
+        self.scale = 1.0  # size relative to the design size, set by TimerPage
+        self.visible = False  # timers on other pages skip their per-tick redraws
+
+        self.renderer = renderer
+        self.animator = animator
+        self.create_widgets(parent)
+
+        self.bind(session)
+
+    def create_widgets(self, parent):
+        """
+        Creates the frame, progressbar and subject list of the timer
         """
         self.frame = ttk.Frame(parent, padding=10)
         self.frame.grid_rowconfigure(2, weight=1)  # expand Info to bottom
 
-        self.callback = callback
-        self.duration = duration
-        self.subjects = subjects_with_duration
+        self.progress_bar = ProgressBar(self.frame, self.renderer)
+        self.subject_list = SubjectList(self.frame, [])
 
-        self.progress_bar = ProgressBar(self.frame)
-        self.subject_list = SubjectList(self.frame, subjects_with_duration)
+    def bind(self, session):
+        """
+        Shows a session, used for new timers and when a pooled timer is reused
 
-        self.is_running = False
-        self.finished = False
+        Args:
+            session (engine.TimerSession): session holding the timer's state
+        """
+        self.session = session
+        self.subject_list.set_subjects(session.subjects)
 
         # update text to show duration
-        self.progress_bar.update(datetime.timedelta(0), duration, duration)
+        self.progress_bar.update(session.elapsed, session.remaining, session.duration)
+
+        self.session.subscribe(self.handle_event)
+
+    @property
+    def duration(self):
+        return self.session.duration
+
+    @property
+    def subjects(self):
+        return self.session.subjects
+
+    @property
+    def is_idle(self):
+        return self.session.is_idle
+
+    @property
+    def is_running(self):
+        return self.session.is_running
+
+    @property
+    def is_paused(self):
+        return self.session.is_paused
+
+    @property
+    def finished(self):
+        return self.session.finished
 
-    def start_timer(self):
+    def handle_event(self, event, session):
         """
-        Calculates the start time, end time, 5 and 30min warnings if applicable
-        Adds this information in an info frame (Info class)
+        Redraws the timer whenever its TimerSession changes
+
+        Args:
+            event (str): name of the event, see engine.TimerSession
+            session (engine.TimerSession): the session that changed
         """
-        self.start_time = datetime.datetime.now()
-        self.end_time = self.start_time + self.duration
-        if self.duration > datetime.timedelta(minutes=30):
-            self.thirty_min = self.end_time - datetime.timedelta(minutes=30)
-        else:
-            self.thirty_min = None
+        if event == "start":
+            # show the start/end times, 5 and 30min warnings if applicable
+            self.info = self.create_info(session)
+            self.update_animation()
+        elif event in ("pause", "resume"):
+            self.update_animation()
+        elif event == "tick":
+            if self.visible:
+                self.progress_bar.update(
+                    session.elapsed, session.remaining, session.duration
+                )
+        elif event == "shift":
+            self.info.update_times(session.start_time, session.end_time)
+        elif event in ("thirty_min", "five_min"):
+            self.progress_bar.alert(event)
+        elif event == "stop":
+            self.update_animation()
+            self.progress_bar.clear_alert()
+            self.progress_bar.update(
+                session.elapsed, session.remaining, session.duration
+            )
+            self.info.destroy()
+            self.info = None
+        elif event == "finish":
+            self.update_animation()
+            self.finish()
 
-        if self.duration > datetime.timedelta(minutes=5):
-            self.five_min = self.end_time - datetime.timedelta(minutes=5)
-        else:
-            self.five_min = None
+    def create_info(self, session):
+        """
+        Returns:
+            Info: start/end times and warnings of the session, shown once started
+        """
+        info = Info(self.frame, session.duration, session.start_time, session.end_time)
+        info.set_scale(self.scale)
+        return info
 
-        self.info = Info(
-            self.frame,
-            self.duration,
-            self.start_time,
-            self.end_time,
-            self.thirty_min,
-            self.five_min,
-        )
+    def set_position(self, position):
+        """
+        Called by TimerPage.draw_timers() to grid the timer at a (row, column)
+        of the page, or to take it off the page if position is None
+        """
+        if position == self.position:
+            return
+
+        if position is None:
+            self.frame.grid_remove()
+        else:
+            self.frame.grid(row=position[0], column=position[1], sticky="nsew")
+        self.position = position
 
-        self.is_running = True
-        self.update_loop()
-        
-    def pause_timer(self):
-        self.is_running = False
-        self.paused_time = datetime.datetime.now()
-
-    def stop_timer(self):
-        self.is_running = False
-        self.elapsed = datetime.timedelta(0)
-        self.remaining = self.duration
-        self.progress_bar.update(self.elapsed, self.remaining, self.duration)
-        self.info.frame.destroy()
-        
-    def resume_timer(self):
-        self.is_running = True
-        pause_duration = datetime.datetime.now() - self.paused_time
-        self.start_time += pause_duration  # adjust the start time
-        self.end_time += pause_duration  # adjust the end time
-        self.info.end_time = self.end_time  # update the end time in the Info class
-        self.update_loop()
-
-    def update_loop(self):
-        """
-        Calculates the elapsed and remaining time
-        If the timer is over, calls the finish() function
-        """
-        
-        if not self.is_running:
+    def update_animation(self):
+        """
+        Animates the progressbar while the timer is running and on the page,
+        otherwise its progress is set by the tick
+        """
+        if not self.animator:
             return
-    
-        self.elapsed = datetime.datetime.now() - self.start_time
-        self.remaining = self.end_time - datetime.datetime.now()
 
-        if datetime.datetime.now() >= self.end_time and not self.finished:
-            self.finish()
+        if self.visible and self.is_running:
+            self.animator.add(self.progress_bar, self.session)
         else:
-            self.progress_bar.update(self.elapsed, self.remaining, self.duration)
-            self.frame.after(1000, self.update_loop)
+            self.animator.remove(self.progress_bar)
+
+    def set_visible(self, visible):
+        """
+        Called by TimerPage.draw_timers() as the timer is shown or hidden
+        A timer that is shown again is brought up to date straight away.
+
+        Args:
+            visible (bool): whether the timer is on the current page
+        """
+        if visible and not self.visible:
+            self.progress_bar.update(
+                self.session.elapsed, self.session.remaining, self.duration
+            )
+        self.visible = visible
+        self.update_animation()
+
+    def set_scale(self, scale):
+        """
+        Resizes the timer, called by TimerPage.draw_timers() after the window
+        is resized
+
+        Args:
+            scale (float): size relative to the 1920x1080 design size
+        """
+        if scale != self.scale:
+            self.scale = scale
+            self.progress_bar.set_scale(scale)
+            self.subject_list.set_scale(scale)
+            if self.info:
+                self.info.set_scale(scale)
 
     def add_subject(self, subject):
         """
@@ -114,47 +206,108 @@ class Timer:
         self.subjects.append(subject)
         self.subject_list.add_subject(subject)
 
+    def update_subject(self, subject):
+        """
+        Refreshes a subject's label after its sections were edited
+
+        Args:
+            subject (Subject): Subject object to refresh
+        """
+        self.subject_list.update_subject(subject)
+
+    def remove_subject(self, subject_id):
+        """
+        Removes a subject from the timer along with its label
+
+        Args:
+            subject_id (int): id of the subject to remove
+        """
+        self.subjects[:] = [
+            subject for subject in self.subjects if subject.id != subject_id
+        ]
+        self.subject_list.remove_subject(subject_id)
+
     def finish(self):
         """
         Sets the progress bar to full and crosses out the elapsed/remaining text
         Hides the Info frame
         Calls TimerPage.finish()
         """
-        self.finished = True
-
         self.progress_bar.update(self.duration, datetime.timedelta(0), self.duration)
         self.progress_bar.set_overstrike()
-        self.info.frame.destroy()
+        self.info.destroy()
+        self.info = None
 
         self.callback(self.subjects)
 
+    def release(self):
+        """
+        Stops listening to the session and hides the timer so it can be reused
+        """
+        self.session.unsubscribe(self.handle_event)
+        self.visible = False
+        self.update_animation()
+        if self.renderer:
+            self.renderer.discard(self.progress_bar)
+        if self.info:
+            self.info.destroy()
+            self.info = None
+
+        self.progress_bar.reset()
+        self.subject_list.set_subjects([])
+
+        self.set_position(None)
+
+    def destroy(self):
+        """
+        Destroys the UI and stops listening to the session
+        """
+        self.release()
+        self.frame.destroy()
+
 
 class ProgressBar:
-    def __init__(self, parent) -> None:
+    def __init__(self, parent, renderer=None) -> None:
         """
         Initializes the UI for the progressbar and elapsed/remaining text
 
         Args:
             parent (ttk.Frame): parent Timer frame
+            renderer (render.RenderQueue, optional): batches widget writes,
+            they are applied immediately if not given
+        """
+        self.renderer = renderer
+        self.rendered: dict = {}  # last value written to each widget
+        self.scale = 1.0
+        self.overstrike = False
+        self.animated = False  # progress set by a ProgressAnimator, not update()
+
+        self.create_widgets(parent)
+
+    def create_widgets(self, parent):
+        """
+        Creates the canvas with the elapsed/remaining text and the progressbar
         """
         self.canvas = ttk.Canvas(parent, height=120, width=440)
         self.canvas.grid(row=0)
+        self.background = self.canvas.cget("background")
+        self.flash_handle = AfterHandle(self.canvas)
 
-        self.canvas.create_text(
+        self.elapsed_heading = self.canvas.create_text(
             0.0, 0.0, anchor="nw", text="ELAPSED", fill="#121212", font=HEADING[3]
         )
-        self.elapsed_label = ttk.Label(self.canvas, text="47m 13s", font=HEADING[1])
-        self.canvas.create_window(0, 25, anchor="nw", window=self.elapsed_label)
+        self.elapsed_label = DigitReadout(
+            self.canvas, 0, 25, HEADING[1], anchor="nw", text="00:00"
+        )
 
-        self.canvas.create_text(
+        self.remaining_heading = self.canvas.create_text(
             440, 0.0, anchor="ne", text="REMAINING", fill="#121212", font=HEADING[2]
         )
-        self.remaining_label = ttk.Label(
-            self.canvas, text="1h 47m 13s", font=HEADING[1]
+        self.remaining_label = DigitReadout(
+            self.canvas, 440, 25, HEADING[1], anchor="ne", text="00:00"
         )
-        self.canvas.create_window(440, 25, anchor="ne", window=self.remaining_label)
 
-        self.progressbar_value = tk.IntVar()
+        self.progressbar_value = tk.DoubleVar()  # fractions while animated
         self.progressbar = ttk.Progressbar(
             self.canvas,
             orient=HORIZONTAL,
@@ -175,8 +328,6 @@ class ProgressBar:
             duration (datetime.timedelta): total duration of the section
         """
 
-        # TODO: flash warning at 5 and 30min if applicable
-
         if elapsed.total_seconds() < 3600:
             elapsed_text = str(elapsed)[2:7]  # format as MM:SS
         else:
@@ -187,22 +338,136 @@ class ProgressBar:
         else:
             remaining_text = str(remaining).split(".")[0]  # format as HH:MM:SS
 
-        self.elapsed_label.configure(text=elapsed_text)
-        self.remaining_label.configure(text=remaining_text)
+        self.render("elapsed", elapsed_text, self.set_elapsed_text)
+        self.render("remaining", remaining_text, self.set_remaining_text)
+        if not self.animated:
+            self.render(
+                "progress",
+                round(100 * elapsed.total_seconds() / duration.total_seconds()),
+                self.set_progress,
+            )
 
-        self.progressbar_value.set(
-            round(100 * elapsed.total_seconds() / duration.total_seconds())
-        )
+    def render(self, name, value, apply):
+        """
+        Writes a value to a widget only if it differs from what is displayed
+        The write goes through the RenderQueue if there is one
+
+        Args:
+            name (str): which widget is written to
+            value: new value
+            apply (function): called as apply(value) to write to the widget
+        """
+        if self.rendered.get(name) == value:
+            return
+        self.rendered[name] = value
+
+        if self.renderer:
+            self.renderer.queue((self, name), apply, value)
+        else:
+            apply(value)
+
+    def set_elapsed_text(self, text):
+        self.elapsed_label.set(text)
+
+    def set_remaining_text(self, text):
+        self.remaining_label.set(text)
+
+    @property
+    def length(self):
+        """
+        Length of the progressbar in pixels
+        """
+        return round(440 * self.scale)
+
+    def set_progress(self, percent):
+        self.progressbar_value.set(percent)
+
+    def set_background(self, colour):
+        self.canvas.configure(background=colour)
+
+    def alert(self, event):
+        """
+        Flashes the canvas and colours the remaining time at the 30 and 5min marks
+
+        Args:
+            event (str): "thirty_min" or "five_min"
+        """
+        self.clear_alert()
+
+        colour = ALERT_COLOURS[event]
+        self.remaining_label.configure(fill=colour)
+        self.flash(colour, 6)
+
+    def flash(self, colour, count):
+        """
+        Toggles the canvas background between the alert colour and normal
+
+        Args:
+            colour (str): alert colour
+            count (int): toggles left
+        """
+        if count == 0:
+            return
+
+        self.set_background(colour if count % 2 == 0 else self.background)
+        self.flash_handle.schedule(500, self.flash, colour, count - 1)
+
+    def clear_alert(self):
+        """
+        Stops any flashing and resets the colours
+        """
+        self.flash_handle.cancel()
+
+        self.set_background(self.background)
+        self.remaining_label.configure(fill="#121212")
+
+    def reset(self):
+        """
+        Clears alerts and crossing out, used before a pooled timer is reused
+        """
+        self.clear_alert()
+        self.rendered = {}  # write every value on the next update
+
+        if self.overstrike:
+            self.overstrike = False
+            font = scaled_font(HEADING[1], self.scale)
+            self.elapsed_label.configure(font=font)
+            self.remaining_label.configure(font=font)
 
     def set_overstrike(self):
-        font_family, font_size, font_style = HEADING[1].split()
-        self.elapsed_label.configure(
-            font=(font_family, int(font_size), font_style + " overstrike")
+        self.overstrike = True
+        font = scaled_font(HEADING[1], self.scale, "overstrike")
+        self.elapsed_label.configure(font=font)
+        self.remaining_label.configure(font=font)
+
+    def set_scale(self, scale):
+        """
+        Resizes the canvas, text and progressbar
+
+        Args:
+            scale (float): size relative to the design size (440px wide)
+        """
+        self.scale = scale
+        width = round(440 * scale)
+
+        self.canvas.configure(width=width, height=round(120 * scale))
+        self.canvas.itemconfigure(
+            self.elapsed_heading, font=scaled_font(HEADING[3], scale)
         )
-        self.remaining_label.configure(
-            font=(font_family, int(font_size), font_style + " overstrike")
+        self.canvas.coords(self.remaining_heading, width, 0)
+        self.canvas.itemconfigure(
+            self.remaining_heading, font=scaled_font(HEADING[2], scale)
         )
 
+        font = scaled_font(HEADING[1], scale, "overstrike" if self.overstrike else "")
+        self.elapsed_label.configure(font=font)
+        self.elapsed_label.move_to(0, round(25 * scale))
+        self.remaining_label.configure(font=font)
+        self.remaining_label.move_to(width, round(25 * scale))
+
+        self.progressbar.configure(length=width)
+        self.progressbar.place(x=0, y=round(70 * scale))
+
 
 class SubjectList:
     def __init__(self, parent, subjects) -> None:
@@ -214,10 +479,36 @@ class SubjectList:
             parent (ttk.Frame): parent Timer frame
             subjects (list): list of Subject objects in the timer
         """
+        # SubjectLabel for each subject, keyed by subject id
+        self.labels: dict[int, SubjectLabel] = {}
+        self.row_count = 0
+        self.scale = 1.0
+
+        self.create_widgets(parent)
+        self.set_subjects(subjects)
+
+    def create_widgets(self, parent):
+        """
+        Creates the frame the labels are gridded in
+        """
         self.frame = ttk.Frame(parent)
         self.frame.grid(row=1, sticky="nw")
 
-        self.labels: list[SubjectLabel] = []
+        # labels of removed subjects are hidden and reused
+        self.pool = WidgetPool(
+            "SubjectLabel", lambda *details: SubjectLabel(self.frame, *details)
+        )
+
+    def set_subjects(self, subjects):
+        """
+        Replaces every label, used when the timer is reused for another session
+
+        Args:
+            subjects (list): list of Subject objects in the timer
+        """
+        for subject_id in list(self.labels):
+            self.remove_subject(subject_id)
+        self.row_count = 0
 
         for subject in subjects:
             self.add_subject(subject)
@@ -230,19 +521,49 @@ class SubjectList:
             subject (Subject): Subject object to add
         """
 
-        for section in subject.sections:
-            if not section.section_run:
-                self.labels.append(
-                    SubjectLabel(
-                        self.frame,
-                        subject.name,
-                        subject.level,
-                        subject.id,
-                        section.name,
-                    )
-                )
-                self.labels[-1].frame.grid(row=len(self.labels) - 1, sticky="w")
-                break  # we only want the first section not run for each subject
+        # we only want the first section not run for each subject
+        section = subject.next_section()
+        if section:
+            label = self.pool.acquire(
+                subject.name, subject.level, subject.id, section.name
+            )
+            label.set_scale(self.scale)  # pooled labels keep their last scale
+            label.frame.grid(row=self.row_count, sticky="w")
+            self.labels[subject.id] = label
+            self.row_count += 1
+
+    def set_scale(self, scale):
+        """
+        Resizes every label, and the labels added later
+
+        Args:
+            scale (float): size relative to the design size
+        """
+        self.scale = scale
+        for label in self.labels.values():
+            label.set_scale(scale)
+
+    def update_subject(self, subject):
+        """
+        Updates a label to show the subject's first section not run
+
+        Args:
+            subject (Subject): Subject object to update
+        """
+        section = subject.next_section()
+        if section:
+            self.labels[subject.id].update_details(section_name=section.name)
+
+    def remove_subject(self, subject_id):
+        """
+        Removes the label of the subject with the given ID
+
+        Args:
+            subject_id (int): id of the subject to remove
+        """
+        label = self.labels.pop(subject_id, None)
+        if label:
+            self.pool.release(label)
 
 
 class SubjectLabel:
@@ -259,16 +580,19 @@ class SubjectLabel:
             subject_id (int): id of the subject
             section_name (str): name of the section
         """
+        self.scale = 1.0
 
-        self.id = subject_id
-        self.subject_name = subject_name
-        self.subject_level = subject_level
+        self.create_widgets(parent)
+        self.bind(subject_name, subject_level, subject_id, section_name)
 
+    def create_widgets(self, parent):
+        """
+        Creates the subject and section name labels
+        """
         self.frame = ttk.Frame(parent, width=440)
 
         self.subject_name_label = ttk.Label(
             self.frame,
-            text=self.display_name,
             wraplength=440,
             justify="left",
             anchor="w",
@@ -277,27 +601,61 @@ class SubjectLabel:
         )
         self.subject_name_label.grid(row=0, column=0, sticky="w")
 
-        ttk.Label(
+        self.section_name_label = ttk.Label(
             self.frame,
-            text=section_name,
             wraplength=440,
             justify="left",
             anchor="w",
             foreground="#838383",
             font=HEADING[2],
-        ).grid(row=1, column=0, sticky="w")
+        )
+        self.section_name_label.grid(row=1, column=0, sticky="w")
+
+    def bind(self, subject_name, subject_level, subject_id, section_name):
+        """
+        Shows a subject, used for new labels and when a pooled label is reused
+        """
+        self.id = subject_id
+        self.update_details(subject_name, subject_level, section_name)
+
+    def release(self):
+        self.frame.grid_forget()
+
+    def set_scale(self, scale):
+        """
+        Resizes the text and the width it wraps at
+
+        Args:
+            scale (float): size relative to the design size (440px wide)
+        """
+        if scale == self.scale:
+            return
+
+        self.scale = scale
+        width = round(440 * scale)
+        self.frame.configure(width=width)
+        self.subject_name_label.configure(
+            wraplength=width, font=scaled_font(HEADING[1], scale)
+        )
+        self.section_name_label.configure(
+            wraplength=width, font=scaled_font(HEADING[2], scale)
+        )
+
+    def destroy(self):
+        self.frame.destroy()
 
     @property
     def display_name(self):
         return f"{self.subject_name} {'HL' if self.subject_level == 1 else 'SL'}"
 
-    def update_details(self, name=None, level=None):
+    def update_details(self, name=None, level=None, section_name=None):
         """
         Updates the subject name label based on new data
 
         Args:
             name (str): new name of the subject
             level (int): new level of the subject
+            section_name (str): new name of the section
         """
         if name is not None:
             self.subject_name = name
@@ -305,11 +663,12 @@ class SubjectLabel:
             self.subject_level = level
         self.subject_name_label.configure(text=self.display_name)
 
+        if section_name is not None:
+            self.section_name_label.configure(text=section_name)
+
 
 class Info:
-    def __init__(
-        self, parent, duration, start_time, end_time, thirty_min, five_min
-    ) -> None:
+    def __init__(self, parent, duration, start_time, end_time) -> None:
         """
         Initializes the UI for the info section of the timer
 
@@ -318,14 +677,53 @@ class Info:
             duration (datetime.timedelta): total duration of the timer
             start_time (datetime.datetime): start time of the timer
             end_time (datetime.datetime): end time of the timer
-            thirty_min (datetime.datetime): time of the 30-minute mark
-            five_min (datetime.datetime): time of the 5-minute mark
+        """
+        self.duration = duration
+        self.scale = 1.0
+
+        self.create_widgets(parent)
+        self.update_times(start_time, end_time)
+
+    def create_widgets(self, parent):
+        """
+        Creates the start/end times and warnings labels
         """
         self.frame = ttk.Frame(parent, width=440)
         self.frame.grid(row=2, sticky="sw")
         self.frame.grid_rowconfigure(2, weight=1)
 
-        self.duration = (datetime.datetime(1, 1, 1) + duration).strftime("%Hh %Mm")
+        self.times_label = ttk.Label(
+            self.frame,
+            font=HEADING[4],
+            foreground="#838383",
+        )
+        self.times_label.grid(row=0, column=0, sticky="sw")
+        self.warnings_label = ttk.Label(
+            self.frame,
+            font=HEADING[4],
+            foreground="#838383",
+        )
+        self.warnings_label.grid(row=1, column=0, sticky="sw")
+
+    def update_times(self, start_time, end_time):
+        """
+        Updates the start/end times and the 30 and 5min warnings if applicable
+
+        Args:
+            start_time (datetime.datetime): start time of the timer
+            end_time (datetime.datetime): end time of the timer
+        """
+        if self.duration > datetime.timedelta(minutes=30):
+            thirty_min = end_time - datetime.timedelta(minutes=30)
+        else:
+            thirty_min = None
+
+        if self.duration > datetime.timedelta(minutes=5):
+            five_min = end_time - datetime.timedelta(minutes=5)
+        else:
+            five_min = None
+
+        duration = (datetime.datetime(1, 1, 1) + self.duration).strftime("%Hh %Mm")
         self.start_time = start_time.strftime("%H:%M")
         self.end_time = end_time.strftime("%H:%M")
         self.thirty_min = thirty_min.strftime("%H:%M") if thirty_min else None
@@ -340,15 +738,27 @@ class Info:
         else:
             label_text = ""
 
-        ttk.Label(
-            self.frame,
-            text=f"{self.duration} ({self.start_time} → {self.end_time})",
-            font=HEADING[4],
-            foreground="#838383",
-        ).grid(row=0, column=0, sticky="sw")
-        ttk.Label(
-            self.frame,
-            text=label_text,
-            font=HEADING[4],
-            foreground="#838383",
-        ).grid(row=1, column=0, sticky="sw")
+        self.set_text(f"{duration} ({self.start_time} → {self.end_time})", label_text)
+
+    def set_text(self, times, warnings):
+        self.times_label.configure(text=times)
+        self.warnings_label.configure(text=warnings)
+
+    def set_scale(self, scale):
+        """
+        Resizes the text
+
+        Args:
+            scale (float): size relative to the design size
+        """
+        if scale == self.scale:
+            return
+
+        self.scale = scale
+        font = scaled_font(HEADING[4], scale)
+        self.frame.configure(width=round(440 * scale))
+        self.times_label.configure(font=font)
+        self.warnings_label.configure(font=font)
+
+    def destroy(self):
+        self.frame.destroy()